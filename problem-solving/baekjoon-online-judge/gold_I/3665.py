@@ -1,7 +1,7 @@
 # 3665. 최종 순위
 
 import sys
-from collections import deque
+from array import array
 input = sys.stdin.readline
 
 t = int(input())
@@ -9,53 +9,40 @@ t = int(input())
 for i in range(t):
     n = int(input())
     last = list(map(int, input().split()))
-    graph = [[] for j in range(n + 1)]
-    chk = [0 for j in range(n + 1)]
-    result = list()
-    que = deque()
-
-    # 작년 상황에서의 간선과 진입차수
+    # pos[team]: 작년 순위(0부터 시작)
+    # chk[team]: 나보다 앞선 팀의 수(진입차수)
+    # 모든 두 팀 사이에 순서가 있으므로 작년에는 순위 그대로가 진입차수다
+    pos = array('i', [0]) * (n + 1)
     for j in range(n):
-        graph[last[j]] = last[j + 1:]
-        chk[last[j]] = j
-    
+        pos[last[j]] = j
+    chk = pos[:]
+
     m = int(input())
 
     # 올해 상황 추가
+    # 상대 순위가 바뀐 두 팀은 간선 방향만 뒤집히므로 진입차수만 하나씩 옮긴다
     for j in range(m):
         a, b = map(int, input().split())
-        if a in graph[b]:
-            graph[b].remove(a)
+        if pos[a] < pos[b]:
+            chk[a] += 1
+            chk[b] -= 1
+        else:
             chk[a] -= 1
-            graph[a].append(b)
             chk[b] += 1
-        else:
-            graph[a].remove(b)
-            chk[b] -= 1
-            graph[b].append(a)
-            chk[a] += 1
-
-    # 진입차수가 0인 원소 찾아 큐에 추가하기
-    for j in range(1, n + 1):
-        if chk[j] == 0:
-            que.append(j)
 
-    # 큐가 비어 있는 경우 사이클 존재
-    # IMPOSSIBLE 출력
-    if not que:
-        print("IMPOSSIBLE")
+    # 진입차수가 모두 다르면(0 ~ n - 1이 한 번씩) 사이클 없이 순위가 하나로 정해지고
+    # 진입차수가 곧 올해 순위가 된다
+    # 모든 두 팀 사이에 간선이 있으므로 진입차수가 겹치면 사이클이 있다는 뜻이고 IMPOSSIBLE을 출력한다
+    # 순위를 정할 수 없는 경우(?)는 생기지 않는다
+    result = array('i', [0]) * n
+    seen = bytearray(n)
+    for team in range(1, n + 1):
+        if seen[chk[team]]:
+            break
+        seen[chk[team]] = 1
+        result[chk[team]] = team
+    else:
+        print(*result)
         continue
 
-    # 위상정렬
-    while que:
-        now = que.popleft()
-        result.append(now)
-        for element in graph[now]:
-            chk[element] -= 1
-            if chk[element] == 0:
-                que.append(element)
-
-    if len(result) < n:
-        print('IMPOSSIBLE')
-    else:
-        print(*result)
\ No newline at end of file
+    print('IMPOSSIBLE')
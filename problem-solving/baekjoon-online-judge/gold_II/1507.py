@@ -1,6 +1,8 @@
 # 1507. 궁금한 민호
 
 from copy import deepcopy
+from itertools import compress
+from operator import eq, gt
 import sys
 input = sys.stdin.readline
 
@@ -9,19 +11,22 @@ cities = [list(map(int, input().split())) for i in range(n)]
 original = deepcopy(cities)
 result = 0
 
+# 경유지 i를 거치는 이동시간을 j행 단위로 한 번에 계산해 비교한다
 for i in range(n):
     for j in range(n):
-        for k in range(n):
-            if i == j or i == k: continue
-            # 경유지를 거쳐서 이동할 때와 바로 이동할 때의 이동시간이 같으면
-            # 바로 이동할 때의 값을 0으로 바꿔준다
-            if cities[j][k] == cities[j][i] + cities[i][k]:
+        if i == j: continue
+        cost = cities[j][i]
+        via = [cost + b for b in cities[i]]
+        # 경유지를 거쳐서 이동할 때보다 바로 이동할 때 이동시간이 더 길면
+        # -1을 출력하고 종료한다
+        if any(map(gt, cities[j], via)):
+            print(-1)
+            sys.exit()
+        # 경유지를 거쳐서 이동할 때와 바로 이동할 때의 이동시간이 같으면
+        # 바로 이동할 때의 값을 0으로 바꿔준다(도착지가 경유지 자신인 경우는 제외)
+        for k in compress(range(n), map(eq, cities[j], via)):
+            if k != i:
                 original[j][k] = 0
-            # 경유지를 거쳐서 이동할 때보다 바로 이동할 때 이동시간이 더 길면
-            # -1을 출력하고 종료한다
-            elif cities[j][k] > cities[j][i] + cities[i][k]:
-                print(-1)
-                sys.exit()
 
 for i in range(n):
     for j in range(n):
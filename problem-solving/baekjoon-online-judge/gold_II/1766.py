@@ -1,35 +1,61 @@
 # 1766. 문제집
 
 import heapq, sys
+from array import array
 input = sys.stdin.readline
 
+
+# 간선 배열을 CSR(compressed sparse row)로 변환
+# offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+def build(n, src, dst):
+    offset = array('i', [0]) * (n + 2)
+    for s in src:
+        offset[s + 1] += 1
+    for v in range(n + 1):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * len(src)
+    pos = offset[:]
+    for s, d in zip(src, dst):
+        target[pos[s]] = d
+        pos[s] += 1
+    return offset, target
+
+
+# 위상 정렬(칸 알고리즘)
+# 진입차수가 0인 노드 중 번호가 작은 것부터 힙에서 꺼낸다
+def topological_sort(n, offset, target):
+    deg = array('i', [0]) * (n + 1)
+    for v in target:
+        deg[v] += 1
+
+    que = [v for v in range(1, n + 1) if deg[v] == 0]
+    order = array('i')
+
+    while que:
+        now = heapq.heappop(que)
+        order.append(now)
+        for i in range(offset[now], offset[now + 1]):
+            next_point = target[i]
+            deg[next_point] -= 1
+            if deg[next_point] == 0:
+                heapq.heappush(que, next_point)
+
+    return order
+
+
 n, m = map(int, input().split())
-problems = [[] for i in range(n + 1)]
-chk = [0 for i in range(n + 1)]
-result = list()
-que = list()
+src = array('i', [0]) * m
+dst = array('i', [0]) * m
 
 # 데이터 입력
+# a번 문제를 b번 문제보다 먼저 풀어야 하므로 a -> b 간선
 for i in range(m):
-    a, b = map(int, input().split())
-    problems[a].append(b)
-    chk[b] += 1
-
-# 문제 진입차수 리스트를 순회한다
-# 진입차수가 0인 문제는 힙에 추가한다
-for i in range(1, n + 1):
-    if chk[i] == 0:
-        heapq.heappush(que, i)
-
-# 힙에서 그 중 가장 작은 번호를 가진 문제를 뽑는다
-# 문제 선행관계 리스트를 돌며 문제에 연결된 다른 문제의 진입차수를 1씩 뺀다
-# 진입차수가 0인 문제를 발견하면 힙에 추가한다
-while que:
-    now = heapq.heappop(que)
-    result.append(now)
-    for problem in problems[now]:
-        chk[problem] -= 1
-        if chk[problem] == 0:
-            heapq.heappush(que, problem)
-
-print(*result)
\ No newline at end of file
+    src[i], dst[i] = map(int, input().split())
+
+offset, target = build(n, src, dst)
+
+# 진입차수가 0인 문제 중 가장 작은 번호를 가진 문제를 먼저 푼다
+result = topological_sort(n, offset, target)
+
+print(*result)
@@ -1,44 +1,73 @@
 # 4195. 친구 네트워크
 
 import sys
+from array import array
 input = sys.stdin.readline
 
 
-def find(p):
-    if p != root[p]:
-        root[p] = find(root[p])
-    return root[p]
+# 유니온 파인드
+# 이름을 처음 나온 순서대로 번호로 바꿔 두고, 부모와 집합 크기는 번호로 array에 저장한다
+# find, union 중에는 문자열을 해싱하지 않는다
+class DisjointSet:
+    def __init__(self):
+        self.ids = dict()
+        self.parent = array('i')
+        self.size = array('i')
 
+    # 처음 보는 이름이면 다음 번호를 붙인다
+    # 이전 테스트 케이스에서 쓰던 칸이 남아 있으면 늘리지 않고 덮어쓴다
+    def intern(self, name):
+        p = self.ids.get(name)
+        if p is None:
+            p = self.ids[name] = len(self.ids)
+            if p < len(self.parent):
+                self.parent[p] = p
+                self.size[p] = 1
+            else:
+                self.parent.append(p)
+                self.size.append(1)
+        return p
 
-def union(p1, p2):
-    p1, p2 = find(p1), find(p2)
-    if p1 == p2: return friend[p1]
-    root[p2] = p1
+    # 다음 테스트 케이스를 위해 이름 정보만 지우고 배열은 그대로 다시 쓴다
+    def reset(self):
+        self.ids.clear()
 
-    # union 연산을 하게 되면 친구 네트워크의 크기도 업데이트
-    friend[p1] += friend[p2]
-    return friend[p1]
+    # find 연산
+    # 재귀 대신 한 칸 건너뛴 조상을 가리키게 하면서(경로 절반 압축) 루트까지 올라간다
+    def find(self, p):
+        parent = self.parent
+        while p != parent[p]:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    # union 연산
+    # 크기가 작은 집합을 큰 집합 밑에 붙이고, 새로 합쳐졌으면 True를 반환한다
+    def union(self, p1, p2):
+        p1, p2 = self.find(p1), self.find(p2)
+        if p1 == p2: return False
+        if self.size[p1] < self.size[p2]: p1, p2 = p2, p1
+        self.parent[p2] = p1
+        self.size[p1] += self.size[p2]
+        return True
+
+    # p가 속한 집합의 크기
+    def component_size(self, p):
+        return self.size[self.find(p)]
 
 
 t = int(input())
+dsu = DisjointSet()
 
 for i in range(t):
     f = int(input())
-    # 루트 정보와 친구 네트워크의 크기를 위한 두 개의 딕셔너리
-    root = dict()
-    friend = dict()
+    dsu.reset()
 
     for j in range(f):
-        a, b = map(str, input().strip().split())
-
-        # 입력된 이름이 처음으로 입력된 경우
-        if root.get(a) is None:
-            root[a] = a
-            friend[a] = 1
-        if root.get(b) is None:
-            root[b] = b
-            friend[b] = 1
+        a, b = input().split()
+        a, b = dsu.intern(a), dsu.intern(b)
 
         # 입력된 이름 연결하기
-        result = union(a, b)
-        print(result)
\ No newline at end of file
+        # union 연산을 하면 친구 네트워크의 크기도 함께 업데이트된다
+        dsu.union(a, b)
+        print(dsu.component_size(a))
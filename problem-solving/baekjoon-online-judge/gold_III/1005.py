@@ -1,48 +1,76 @@
 # 1005. ACM Craft
 
-from collections import deque
 import sys
+from array import array
 input = sys.stdin.readline
 
+
+# 간선 배열을 CSR(compressed sparse row)로 변환
+# offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+def build(n, src, dst):
+    offset = array('i', [0]) * (n + 2)
+    for s in src:
+        offset[s + 1] += 1
+    for v in range(n + 1):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * len(src)
+    pos = offset[:]
+    for s, d in zip(src, dst):
+        target[pos[s]] = d
+        pos[s] += 1
+    return offset, target
+
+
+# w를 짓는 데 걸리는 시간
+# w보다 먼저 지어야 하는 건물(거꾸로 따라 올라갈 수 있는 건물)만 보면 되므로
+# 뒤집은 그래프에서 w부터 거슬러 올라가며 그 건물들에 대해서만 DP를 한다
+# 건물마다 (먼저 지어야 하는 건물들이 모두 끝난 시간 중 가장 늦은 시간 + 자기 건설 시간)을 finish에 기록해 두므로
+# 같은 그래프에서 이미 구한 건물을 다시 물으면 바로 답한다
+def finish_time(w):
+    stack = [w]
+    while stack:
+        now = stack[-1]
+        if finish[now] >= 0:
+            stack.pop()
+            continue
+
+        ready = True
+        latest = 0
+        for j in range(offset[now], offset[now + 1]):
+            prev = source[j]
+            if finish[prev] < 0:
+                ready = False
+                stack.append(prev)
+            elif latest < finish[prev]:
+                latest = finish[prev]
+
+        # 먼저 지어야 하는 건물의 시간이 모두 정해졌으면 이 건물의 시간도 정해진다
+        if ready:
+            finish[now] = latest + time[now]
+            stack.pop()
+
+    return finish[w]
+
+
 t = int(input())
 
 for i in range(t):
     n, k = map(int, input().split())
     # 건설 소요 시간
-    time = [0] + list(map(int, input().split()))
+    time = array('i', [0] + list(map(int, input().split())))
     # 건설 순서
-    building = [[] for j in range(n + 1)]
-    # 진입차수
-    deg = [0 for j in range(n + 1)]
-    dp = [0 for j in range(n + 1)]
+    src = array('i', [0]) * k
+    dst = array('i', [0]) * k
 
     for j in range(k):
-        x, y = map(int, input().split())
-        building[x].append(y)
-        deg[y] += 1
+        src[j], dst[j] = map(int, input().split())
 
     # 승리 조건
     w = int(input())
 
-    que = deque()
-    for j in range(1, n + 1):
-        # 진입차수가 0인 건물 번호를 큐에 넣는다
-        # 리스트 dp의 해당하는 원소 값을 해당 건물 건설 소요 시간으로 설정한다
-        if deg[j] == 0:
-            que.append(j)
-            dp[j] = time[j]
-
-    while que:
-        now = que.popleft()
-        for next_point in building[now]:
-            # 다음 건물의 진입차수를 1 뺀 후
-            # 리스트 dp의 다음 건물에 해당하는 원소 값을
-            # 현재 건물 건설까지 걸린 소요 시간 + 다음 건물 건설 소요 시간과
-            # 다음 건물 건설 소요 시간 중 더 큰 것으로 설정한다
-            deg[next_point] -= 1
-            dp[next_point] = max(dp[now] + time[next_point], dp[next_point])
-            # 다음 건물의 진입차수가 0이라면 큐에 다음 건물 번호를 넣는다
-            if deg[next_point] == 0:
-                que.append(next_point)
-
-    print(dp[w])
\ No newline at end of file
+    # x -> y를 뒤집어 y에서 먼저 지어야 하는 x로 거슬러 올라간다
+    offset, source = build(n, dst, src)
+    finish = array('q', [-1]) * (n + 1)
+
+    print(finish_time(w))
@@ -1,32 +1,65 @@
 # 11779. 최소비용 구하기 2
 
 import sys, heapq
+from array import array
 input = sys.stdin.readline
 
 n = int(input())
 m = int(input())
-bus = [[] for i in range(n + 1)]
-result = [int(1e9)] * (n + 1)
+INF = int(1e9)
+
+# 간선을 (출발, 도착, 비용) 배열로 먼저 받는다
+src = array('i', [0]) * m
+dst = array('i', [0]) * m
+cost = array('i', [0]) * m
 
 for i in range(m):
-    start, end, cost = map(int, input().split())
-    bus[start].append((cost, end))
+    src[i], dst[i], cost[i] = map(int, input().split())
+
+# CSR(compressed sparse row)로 변환
+# offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+offset = array('i', [0]) * (n + 2)
+for s in src:
+    offset[s + 1] += 1
+for v in range(n + 1):
+    offset[v + 1] += offset[v]
+
+target = array('i', [0]) * m
+weight = array('i', [0]) * m
+pos = offset[:]
+for i in range(m):
+    s = src[i]
+    target[pos[s]] = dst[i]
+    weight[pos[s]] = cost[i]
+    pos[s] += 1
 
 initial, final = map(int, input().split())
-points = [initial] * (n + 1)
-que = [(0, initial)]
+
+# 힙에는 (거리 << SHIFT) | 노드 형태의 정수 하나만 넣는다
+SHIFT = (n + 1).bit_length()
+MASK = (1 << SHIFT) - 1
+result = [INF] * (n + 1)
+result[initial] = 0
+# 직전 노드를 기록해 경로를 복원한다
+points = array('i', [initial]) * (n + 1)
+que = [initial]
 
 # 다익스트라
+# 도착 도시가 힙에서 나오면 거리와 경로가 확정되므로 바로 멈춘다
 while que:
-    length, point = heapq.heappop(que)
+    key = heapq.heappop(que)
+    length, point = key >> SHIFT, key & MASK
 
     if length > result[point]: continue
+    if point == final: break
 
-    for next_length, next_point in bus[point]:
-        if length + next_length < result[next_point]:
-            heapq.heappush(que, (length + next_length, next_point))
-            result[next_point] = length + next_length
+    for i in range(offset[point], offset[point + 1]):
+        next_point = target[i]
+        next_length = length + weight[i]
+        if next_length < result[next_point]:
+            result[next_point] = next_length
             points[next_point] = point
+            heapq.heappush(que, next_length << SHIFT | next_point)
 
 route = list()
 temp = final
@@ -40,4 +73,4 @@ route.append(initial)
 
 print(result[final])
 print(len(route))
-print(*route[::-1])
\ No newline at end of file
+print(*route[::-1])
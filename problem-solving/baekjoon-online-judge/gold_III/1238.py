@@ -1,48 +1,80 @@
 # 1238. 파티
 
 import sys, heapq
+from array import array
 input = sys.stdin.readline
 
+# 간선 배열을 CSR(compressed sparse row)로 변환
+# offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+def build(src, dst):
+    offset = array('i', [0]) * (n + 2)
+    for s in src:
+        offset[s + 1] += 1
+    for v in range(n + 1):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * m
+    weight = array('i', [0]) * m
+    pos = offset[:]
+    for i in range(m):
+        s = src[i]
+        target[pos[s]] = dst[i]
+        weight[pos[s]] = cost[i]
+        pos[s] += 1
+
+    return offset, target, weight
+
 # 다익스트라
-# rev = True일 때 rev_road
-# rev = False일 때 road
-def dijkstra(rev):
-    result = [int]
-    result = [int(1e9) for i in range(n + 1)]
-    result[x] = 0
-    que = [x]
-    
-    if rev:
-        while que:
-            point = heapq.heappop(que)
-
-            for next_time, next_point in rev_road[point]:
-                if result[point] + next_time < result[next_point]:
-                    result[next_point] = result[point] + next_time
-                    heapq.heappush(que, next_point)
-    else:
-        while que:
-            point = heapq.heappop(que)
-
-            for next_time, next_point in road[point]:
-                if result[point] + next_time < result[next_point]:
-                    result[next_point] = result[point] + next_time
-                    heapq.heappush(que, next_point)
-    
-    return result
+# sources의 각 원소는 (출발 마을, rev)이다
+# rev = True일 때 뒤집은 그래프, rev = False일 때 원래 그래프를 사용한다
+# 모든 출발지를 힙 하나, 반복문 하나로 처리하고 k번째 출발지의 거리는 result[k * (n + 1) + v]에 담긴다
+# 힙에는 (거리 << shift) | 인덱스 형태의 정수 하나만 넣고, 거리가 짧은 것부터 꺼낸다
+def dijkstra(sources):
+    size = n + 1
+    shift = (len(sources) * size).bit_length()
+    mask = (1 << shift) - 1
+    graphs = [graph[rev] for town, rev in sources]
+    result = array('i', [INF]) * (len(sources) * size)
+    que = list()
+    for k, (town, rev) in enumerate(sources):
+        result[k * size + town] = 0
+        que.append(k * size + town)
+    heapq.heapify(que)
+
+    while que:
+        key = heapq.heappop(que)
+        time, index = key >> shift, key & mask
+        # 이미 더 짧은 거리로 확정된 항목은 건너뛴다
+        if result[index] < time: continue
+        k, point = divmod(index, size)
+        base = index - point
+        offset, target, weight = graphs[k]
+
+        for i in range(offset[point], offset[point + 1]):
+            next_index = base + target[i]
+            next_time = time + weight[i]
+            if next_time < result[next_index]:
+                result[next_index] = next_time
+                heapq.heappush(que, next_time << shift | next_index)
+
+    return [result[k * size:(k + 1) * size] for k in range(len(sources))]
 
 n, m, x = map(int, input().split())
-road = [[] for i in range(n + 1)]
-rev_road = [[] for i in range(n + 1)]
+INF = int(1e9)
+
+start = array('i', [0]) * m
+end = array('i', [0]) * m
+cost = array('i', [0]) * m
 
-# 도로 정보를 그대로(rev = False) 받거나 뒤집어서(rev = True) 받거나
 for i in range(m):
-    start, end, cost = map(int, input().split())
-    road[start].append((cost, end))
-    rev_road[end].append((cost, start))
+    start[i], end[i], cost[i] = map(int, input().split())
+
+# 도로 정보를 그대로 받은 그래프(graph[False])와 뒤집어서 받은 그래프(graph[True])
+# 같은 간선 배열에서 한 번씩만 만든다
+graph = (build(start, end), build(end, start))
 
-first = dijkstra(True)
-second = dijkstra(False)
+# 각 마을 -> x는 뒤집은 그래프에서, x -> 각 마을은 원래 그래프에서 구한다
+first, second = dijkstra([(x, True), (x, False)])
 answer = 0
 
 # 최대 이동 시간을 구한다
@@ -50,4 +82,4 @@ for i in range(1, n + 1):
     temp = first[i] + second[i]
     answer = max(answer, temp)
 
-print(answer)
\ No newline at end of file
+print(answer)
@@ -1,40 +1,58 @@
 # 14442. 벽 부수고 이동하기 2
 
-from collections import deque
+from array import array
 import sys
 input = sys.stdin.readline
 
+# 바깥 칸
+# 칸에 들어갈 때 부수는 벽의 수를 칸의 값으로 두므로(빈 칸 0, 벽 1)
+# 바깥은 k보다 큰 값으로 두어 몇 번을 부숴도 들어갈 수 없게 한다
+OUT = 255
+
 def bfs():
-    result = [[[0 for i in range(k + 1)] for j in range(m)] for l in range(n)]
-    que = deque([[0, 0, 0]])
-    result[0][0][0] = 1
+    start, end = W + 1, n * W + m
+    K = k + 1
+    # fewest[칸]: 지금까지 그 칸에 도착했을 때 부순 벽의 최소 개수
+    # 거리 순서대로 진행하므로 같은 칸에 같거나 더 많은 벽을 부수고 다시 도착하는 상태는
+    # 더 먼저 도착한 상태보다 나을 것이 없어서 버린다
+    fewest = bytearray([K]) * size
+    fewest[start] = 0
 
     # BFS
     # 2206. 벽 부수고 이동하기와 비슷하다
-    while que:
-        r, c, h = que.popleft()
-        if r == n - 1 and c == m - 1:
-            return result[r][c][h]
-
-        for i in range(4):
-            nr = r + dr[i]
-            nc = c + dc[i]
-            if (0 <= nr < n) and (0 <= nc < m):
-                # 벽을 부수지 않고도 진행할 수 있는 경우
-                if not graph[nr][nc] and not result[nr][nc][h]:
-                    result[nr][nc][h] = result[r][c][h] + 1
-                    que.append([nr, nc, h])
-                # 벽을 부수면 진행할 수 있는 경우
-                # result[nr][nc][h + 1]을 확인하는 부분이 있어야 한다
-                elif graph[nr][nc] and (h < k) and not result[nr][nc][h + 1]:
-                    result[nr][nc][h + 1] = result[r][c][h] + 1
-                    que.append([nr, nc, h + 1])
-    
-    return -1
+    # 상태는 칸 * (k + 1) + 부순 벽의 수 정수 하나로 나타내고, 거리가 같은 상태끼리 한 번에 진행한다
+    frontier = array('i', [start * K])
+    length = 1
+    while frontier:
+        next_frontier = array('i')
+        for state in frontier:
+            now, h = divmod(state, K)
+            if now == end:
+                return length
 
-dr = [0, 0, -1, 1]
-dc = [1, -1, 0, 0]
+            for move in moves:
+                next_point = now + move
+                # 벽이면 하나를 더 부수고 진행한다
+                broken = h + space[next_point]
+                if broken < fewest[next_point]:
+                    fewest[next_point] = broken
+                    next_frontier.append(next_point * K + broken)
+
+        frontier = next_frontier
+        length += 1
+
+    return -1
 
 n, m, k = map(int, input().split())
-graph = [list(map(int, input().rstrip())) for i in range(n)]
-print(bfs())
\ No newline at end of file
+
+# 지도를 한 줄로 펴고 바깥을 OUT으로 한 칸 둘러싼다
+# (r, c) 칸은 (r + 1) * W + (c + 1)이므로 상하좌우 이동은 ±1, ±W이고
+# 바깥 칸에서 멈추므로 범위 검사가 필요 없다
+W = m + 2
+size = (n + 2) * W
+moves = (1, -1, W, -W)
+space = bytearray([OUT]) * size
+for i in range(n):
+    space[(i + 1) * W + 1:(i + 1) * W + m + 1] = bytes(map(int, input().rstrip()))
+
+print(bfs())
@@ -1,14 +1,65 @@
 # 1516. 게임 개발
 
-from collections import deque
 import sys
+from array import array
 input = sys.stdin.readline
 
+
+# 간선 배열을 CSR(compressed sparse row)로 변환
+# offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+def build(n, src, dst):
+    offset = array('i', [0]) * (n + 2)
+    for s in src:
+        offset[s + 1] += 1
+    for v in range(n + 1):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * len(src)
+    pos = offset[:]
+    for s, d in zip(src, dst):
+        target[pos[s]] = d
+        pos[s] += 1
+    return offset, target
+
+
+# 위상 정렬(칸 알고리즘)
+# 진입차수가 0이 된 순서대로 꺼내고, 결과 배열 자체를 큐로 쓴다(head ~ tail 구간이 큐)
+# 각 노드가 끝나는 가장 늦은 시간(선행 노드들이 끝난 뒤 자기 시간을 더한 값)을 구해 반환한다
+def topological_sort(n, offset, target, time):
+    deg = array('i', [0]) * (n + 1)
+    for v in target:
+        deg[v] += 1
+
+    order = array('i', [0]) * n
+    head = tail = 0
+    for v in range(1, n + 1):
+        if deg[v] == 0:
+            order[tail] = v
+            tail += 1
+
+    start = array('q', [0]) * (n + 1)
+    finish = array('q', [0]) * (n + 1)
+
+    while head < tail:
+        now = order[head]
+        head += 1
+        finish[now] = start[now] + time[now]
+        for i in range(offset[now], offset[now + 1]):
+            next_point = target[i]
+            if start[next_point] < finish[now]:
+                start[next_point] = finish[now]
+            deg[next_point] -= 1
+            if deg[next_point] == 0:
+                order[tail] = next_point
+                tail += 1
+
+    return finish
+
+
 n = int(input())
-buildings = [[] for i in range(n + 1)]
-time = [0 for i in range(n + 1)]
-deg = [0 for i in range(n + 1)]
-dp = [0 for i in range(n + 1)]
+time = array('i', [0]) * (n + 1)
+src = array('i')
+dst = array('i')
 
 for i in range(1, n + 1):
     # 건물 정보 입력받기
@@ -16,26 +67,12 @@ for i in range(1, n + 1):
     # 그 다음부터 -1 전까지는 해당 건물을 짓기 전에 건설되어야 하는 건물 번호
     ipt = list(map(int, input().split()))
     time[i] = ipt[0]
-    for num in ipt[1:]:
-        if num != -1:
-            buildings[num].append(i)
-            deg[i] += 1
+    for num in ipt[1:-1]:
+        src.append(num)
+        dst.append(i)
 
-que = deque()
+# 건물마다 (먼저 지어야 하는 건물들이 모두 끝난 시간 중 가장 늦은 시간 + 자기 건설 시간)을 구한다
+offset, target = build(n, src, dst)
+finish = topological_sort(n, offset, target, time)
 
-# 초기에 진입 차수가 0인 건물을 찾아 큐에 넣고
-# 최종 시간 리스트(dp)의 해당 원소를 건물 건설 시간으로 설정한다
-for i in range(1, n + 1):
-    if not deg[i]:
-        que.append(i)
-        dp[i] = time[i]
-
-while que:
-    now = que.popleft()
-    for next_point in buildings[now]:
-        deg[next_point] -= 1
-        dp[next_point] = max(dp[now] + time[next_point], dp[next_point])
-        if not deg[next_point]:
-            que.append(next_point)
-
-print(*dp[1:], sep='\n')
\ No newline at end of file
+print(*finish[1:], sep='\n')
@@ -4,35 +4,35 @@ import sys
 input = sys.stdin.readline
 
 n, k = map(int, input().split())
-graph = [[int(1e9) for i in range(n)] for j in range(n)]
-rev_graph = [[int(1e9) for i in range(n)] for j in range(n)]
+
+# reach[a]의 b번째 비트가 켜져 있으면 a번 사건이 b번 사건보다 먼저 일어났다
+# 자기 자신은 처음부터 켜 둔다
+reach = [1 << i for i in range(n)]
 
 for i in range(k):
     a, b = map(int, input().split())
-    graph[a - 1][b - 1] = 1
-    rev_graph[b - 1][a - 1] = 1
+    reach[a - 1] |= 1 << (b - 1)
 
 s = int(input())
 question = [list(map(int, input().split())) for i in range(s)]
 
+# 플로이드-워셜(도달 가능 여부만)
+# j가 i보다 먼저라면 i보다 나중인 사건은 모두 j보다도 나중이다
 for i in range(n):
-    graph[i][i] = 0
-    rev_graph[i][i] = 0
-
-# 플로이드-워셜
-for i in range(n):
+    bit = 1 << i
+    via = reach[i]
     for j in range(n):
-        for k in range(n):
-            graph[j][k] = min(graph[j][k], graph[j][i] + graph[i][k])
-            rev_graph[j][k] = min(rev_graph[j][k], rev_graph[j][i] + rev_graph[i][k])
+        if reach[j] & bit:
+            reach[j] |= via
 
-# 뒤집은 그래프와 뒤집지 않은 그래프에서 값에 변화가 있었다면 1과 -1을 출력하고
-# 변화가 없으면 0을 출력한다
+# front -> end로 이어지면 -1, end -> front로 이어지면 1을 출력하고
+# 어느 쪽으로도 이어지지 않으면 0을 출력한다
+# 뒤집은 방향은 따로 저장하지 않고 reach[end]의 front번째 비트로 확인한다
 for element in question:
     front, end = element
-    if graph[front - 1][end - 1] != int(1e9):
+    if reach[front - 1] >> (end - 1) & 1:
         print(-1)
-    elif rev_graph[front - 1][end - 1] != int(1e9):
+    elif reach[end - 1] >> (front - 1) & 1:
         print(1)
     else:
-        print(0)
\ No newline at end of file
+        print(0)
@@ -1,79 +1,90 @@
 # 17142. 연구소 3
 
-from collections import deque
-from itertools import combinations
+from array import array
 import sys
 input = sys.stdin.readline
 
 
-dr = [0, 0, 1, -1]
-dc = [1, -1, 0, 0]
-
-
-def bfs(v):
-    que = deque()
-    visited = [[-1 for i in range(n)] for j in range(n)]
-
-    for r, c in v:
-        que.append((r, c))
-        visited[r][c] = 0
-    
-    time = 0
-    chk = 0
-
-    while que:
-        r, c = que.popleft()
-        for i in range(4):
-            nr, nc = r + dr[i], c + dc[i]
-            if (0 <= nr < n) and (0 <= nc < n):
-                # 방문한 적 없는 빈 칸
-                if not lab[nr][nc] and visited[nr][nc] == -1:
-                    que.append((nr, nc))
-                    visited[nr][nc] = visited[r][c] + 1
-                    # 시간 최대값으로 갱신
-                    time = max(time, visited[nr][nc])
-                # 비활성 바이러스 활성화
-                elif lab[nr][nc] == 2 and visited[nr][nc] == -1:
-                    que.append((nr, nc))
-                    visited[nr][nc] = visited[r][c] + 1
-
-    # 방문하지 않은 지점의 수 세기
-    for i in range(n):
-        for j in range(n):
-            if visited[i][j] == -1:
-                chk += 1
-
-    # 방문하지 않은 지점의 수가 벽의 수와 같으면
-    # 소요 시간 반환
-    if wall == chk:
-        return time
-    # 다르면 1,000,000,000 반환
-    else:
-        return int(1e9)
+INF = int(1e9)
+
+
+# 바이러스 하나만 활성화했을 때 각 칸에 퍼지는 시간
+def bfs(start):
+    visited = array('i', [-1]) * size
+    que[0] = start
+    visited[start] = 0
+    head, tail = 0, 1
+
+    while head < tail:
+        now = que[head]
+        head += 1
+        length = visited[now] + 1
+        for move in moves:
+            next_point = now + move
+            # 방문한 적 없는 빈 칸이나 비활성 바이러스
+            if lab[next_point] != 1 and visited[next_point] == -1:
+                que[tail] = next_point
+                tail += 1
+                visited[next_point] = length
+
+    # 벽이 아닌 칸마다 걸리는 시간
+    # 바이러스 칸은 시간에 들어가지 않으므로 닿으면 0, 닿지 않으면 INF로 둔다
+    return [INF if visited[point] == -1 else visited[point] if not lab[point] else 0 for point in cells]
+
+
+# 고른 바이러스를 함께 활성화하면 각 칸의 시간은 바이러스별 시간 중 최소값이고
+# 답은 그 중 최대값이다
+# partial: 지금까지 고른 바이러스로 구한 칸별 최소값
+# 바이러스를 더 고를수록 시간은 줄어들기만 하므로
+# 남은 바이러스를 모두 더해도(suffix) 지금까지의 답보다 작아지지 않으면 더 볼 필요가 없다
+def search(start, cnt, partial):
+    global result
+
+    if cnt == m:
+        result = min(result, max(partial))
+        return
+
+    for i in range(start, len(virus) - (m - cnt) + 1):
+        # i가 커질수록 suffix[i]가 커지므로 한 번 가지치기되면 뒤도 모두 가지치기된다
+        if max(map(min, partial, suffix[i])) >= result:
+            return
+        search(i + 1, cnt + 1, list(map(min, partial, spread[i])))
 
 
 n, m = map(int, input().split())
 virus = list()
-lab = list()
-wall = 0
+
+# 연구소를 한 줄로 펴고 바깥을 벽(1)으로 한 칸 둘러싼다
+# (r, c) 칸은 (r + 1) * W + (c + 1)이므로 상하좌우 이동은 ±1, ±W이고
+# 바깥 칸에서 멈추므로 범위 검사가 필요 없다
+W = n + 2
+size = W * W
+moves = (1, -1, W, -W)
+lab = bytearray([1]) * size
 
 # 정보 입력
-# 2일 때 바이러스 리스트에 좌표 추가
-# 1일 때 벽의 개수에 1 더하기
+# 2일 때 바이러스 리스트에 칸 번호 추가
 for i in range(n):
-    lab.append(list(map(int, input().split())))
+    row = bytes(map(int, input().split()))
+    lab[(i + 1) * W + 1:(i + 1) * W + n + 1] = row
     for j in range(n):
-        if lab[i][j] == 2:
-            virus.append((i, j))
-        elif lab[i][j] == 1:
-            wall += 1
+        if row[j] == 2:
+            virus.append((i + 1) * W + j + 1)
+
+# 벽이 아닌 칸의 목록
+# 칸마다 큐에 한 번만 들어가므로 큐는 칸 수만큼 미리 잡아 둔다
+cells = [point for point in range(size) if lab[point] != 1]
+que = array('i', [0]) * len(cells)
 
-# 바이러스 리스트 중 m개를 뽑는 조합의 리스트
-virus = list(combinations(virus, m))
-result = int(1e9)
+# 바이러스마다 한 번씩만 BFS
+# suffix[i]: i번째 이후 바이러스를 모두 활성화했을 때의 칸별 시간
+spread = [bfs(v) for v in virus]
+suffix = spread[:]
+for i in range(len(virus) - 2, -1, -1):
+    suffix[i] = list(map(min, spread[i], suffix[i + 1]))
 
 # 최소 소요 시간 구하기
-for v in virus:
-    result = min(result, bfs(v))
+result = INF
+search(0, 0, [INF] * len(cells))
 
-print(-1 if result == int(1e9) else result)
\ No newline at end of file
+print(-1 if result == INF else result)
@@ -1,11 +1,14 @@
 # 1719. 택배
 
 import sys
+from array import array
 input = sys.stdin.readline
+INF = int(1e9)
 
 n, m = map(int, input().split())
-graph = [[1e9 for i in range(n)] for j in range(n)]
-result = [[(i + 1) for i in range(n)] for j in range(n)]
+graph = [[INF for i in range(n)] for j in range(n)]
+# result[j][k]: j에서 k로 갈 때 가장 먼저 거치는 집하장(1부터 시작, 자기 자신은 0)
+result = [array('i', range(1, n + 1)) for j in range(n)]
 
 for i in range(m):
     a, b, c = map(int, input().split())
@@ -14,16 +17,24 @@ for i in range(m):
 # 자기 자신으로 가는 경우 초기화
 for i in range(n):
     graph[i][i] = 0
-    result[i][i] = '-'
+    result[i][i] = 0
 
 # 플로이드-워셜
 # 값에 변화가 생겼을 때 2차원 배열 result에 직전 지점 갱신하기
+# j행에서 i를 거쳐 짧아지는 열을 표시해 두고, 거리 행과 경로 행을 같은 표시로 한 번에 만든다
 for i in range(n):
+    via = graph[i]
     for j in range(n):
-        for k in range(n):
-            if (graph[j][i] + graph[i][k]) < graph[j][k]:
-                graph[j][k] = graph[j][i] + graph[i][k]
-                result[j][k] = result[j][i]
+        cost = graph[j][i]
+        if cost == INF: continue
+        row = graph[j]
+        better = [cost + b < a for a, b in zip(row, via)]
+        if not any(better): continue
+        hop = result[j][i]
+        graph[j] = [cost + b if t else a for t, a, b in zip(better, row, via)]
+        result[j] = array('i', [hop if t else h for t, h in zip(better, result[j])])
 
 for i in range(n):
-    print(*result[i])
\ No newline at end of file
+    row = list(result[i])
+    row[i] = '-'
+    print(*row)
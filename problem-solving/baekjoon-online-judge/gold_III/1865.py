@@ -1,43 +1,97 @@
 # 1865. 웜홀
 
 import sys
+from array import array
+from collections import deque
 input = sys.stdin.readline
-INF = sys.maxsize
-
-# 벨만-포드
-def bellman_ford(start):
-    result[start - 1] = 0
-
-    for i in range(n):
-        for j in range(len(way)):
-            s, e, t = way[j]
-            if result[s - 1] + t < result[e - 1]:
-                result[e - 1] = result[s - 1] + t
-                # n - 1번 순회한 후 n번째에도 값에 변화가 생기면
-                # 음수 사이클이 존재한다는 뜻
-                # True를 반환한다
-                if i == (n - 1):
-                    return True
-    # 음수 사이클이 없으니 False를 반환한다
-    return False
+
+# 음수 사이클 찾기
+# 모든 지점과 길이 0인 간선으로 이어진 가상의 출발점이 있다고 보고
+# 처음부터 모든 지점의 거리를 0으로 두고 모든 지점을 큐에 넣는다
+# 어느 지점에서 시작해도 돌아왔을 때 시간이 되돌아가 있는 사이클이면 되므로 1번 지점만 볼 필요가 없다
+def spfa():
+    distance = [0] * (n + 1)
+    cnt = [0] * (n + 1)
+    prev = [0] * (n + 1)
+    inque = [True] * (n + 1)
+    que = deque(range(1, n + 1))
+
+    # 큐가 빌 때 멈추므로 값이 더 이상 바뀌지 않으면 n번을 다 돌지 않는다
+    while que:
+        point = que.popleft()
+        inque[point] = False
+        for i in range(offset[point], offset[point + 1]):
+            next_point = target[i]
+            next_time = distance[point] + weight[i]
+            if next_time < distance[next_point]:
+                distance[next_point] = next_time
+                prev[next_point] = point
+                cnt[next_point] = cnt[point] + 1
+                # 간선 n개 이상을 거친 최단 경로가 나오면 음수 사이클이 있다는 뜻
+                # 사이클을 이루는 지점을 찾으면 반환하고, 아직 prev에 드러나지 않았으면 계속 진행한다
+                if cnt[next_point] >= n:
+                    cycle = find_cycle(next_point, prev)
+                    if cycle: return cycle
+                if not inque[next_point]:
+                    inque[next_point] = True
+                    # SLF: 큐 맨 앞보다 거리가 짧으면 앞에 넣는다
+                    if que and next_time < distance[que[0]]:
+                        que.appendleft(next_point)
+                    else:
+                        que.append(next_point)
+
+    # 음수 사이클이 없으니 빈 리스트를 반환한다
+    return []
+
+# prev를 따라가다 같은 지점을 다시 만나면 그 사이의 지점들이 음수 사이클이다
+def find_cycle(point, prev):
+    visited = dict()
+    while point and point not in visited:
+        visited[point] = len(visited)
+        point = prev[point]
+    if not point: return []
+
+    cycle = [point]
+    temp = prev[point]
+    while temp != point:
+        cycle.append(temp)
+        temp = prev[temp]
+    return cycle[::-1]
 
 tc = int(input())
 
 for i in range(tc):
     n, m, w = map(int, input().split())
-    result = [INF for j in range(n)]
-    way = list()
+    src = array('i', [0]) * (2 * m + w)
+    dst = array('i', [0]) * (2 * m + w)
+    time = array('i', [0]) * (2 * m + w)
 
+    # 도로는 양방향
     for j in range(m):
         s, e, t = map(int, input().split())
-        way.append((s, e, t))
-        way.append((e, s, t))
+        src[2 * j], dst[2 * j], time[2 * j] = s, e, t
+        src[2 * j + 1], dst[2 * j + 1], time[2 * j + 1] = e, s, t
 
-    for j in range(w):
+    # 웜홀은 한 방향이고 시간이 거꾸로 간다
+    for j in range(2 * m, 2 * m + w):
         s, e, t = map(int, input().split())
-        way.append((s, e, -1 * t))
+        src[j], dst[j], time[j] = s, e, -t
+
+    # CSR(compressed sparse row)로 변환
+    offset = array('i', [0]) * (n + 2)
+    for s in src:
+        offset[s + 1] += 1
+    for v in range(n + 1):
+        offset[v + 1] += offset[v]
 
-    chk = bellman_ford(1)
+    target = array('i', [0]) * (2 * m + w)
+    weight = array('i', [0]) * (2 * m + w)
+    pos = offset[:]
+    for j in range(2 * m + w):
+        s = src[j]
+        target[pos[s]] = dst[j]
+        weight[pos[s]] = time[j]
+        pos[s] += 1
 
-    if chk: print('YES')
-    else: print('NO')
\ No newline at end of file
+    if spfa(): print('YES')
+    else: print('NO')
@@ -1,40 +1,56 @@
 # 2206. 벽 부수고 이동하기
 
-from collections import deque
+from array import array
 import sys
 input = sys.stdin.readline
 
-dr = [0, 0, -1, 1]
-dc = [1, -1, 0, 0]
+# 바깥 칸
+# 칸에 들어갈 때 부수는 벽의 수를 칸의 값으로 두므로(빈 칸 0, 벽 1)
+# 바깥은 충분히 큰 값으로 두어 벽을 부숴도 들어갈 수 없게 한다
+OUT = 255
 
 # BFS
-# [i][j][k]에서 k: 벽을 부순 적이 없는 경우(0)/부순 경우(1)
+# 상태는 칸 * 2 + h 정수 하나로 나타낸다: h는 벽을 부순 적이 없는 경우(0)/부순 경우(1)
+# 거리가 같은 상태끼리 한 번에 진행한다
 def bfs():
-    que = deque([[0, 0, 0]])
-    visited[0][0][0] = 1
-
-    while que:
-        r, c, h = que.popleft()
-        if r == n - 1 and c == m - 1:
-            return visited[r][c][h]
-        for i in range(4):
-            nr = r + dr[i]
-            nc = c + dc[i]
-
-            if (0 <= nr < n) and (0 <= nc < m):
-                # 벽을 부술 필요가 없고, 방문한 적도 없는 경우
-                if not space[nr][nc] and not visited[nr][nc][h]:
-                    visited[nr][nc][h] = visited[r][c][h] + 1
-                    que.append([nr, nc, h])
-                # 벽인데 지금까지 벽을 부순 적이 없는 경우
-                elif space[nr][nc] and not h:
-                    visited[nr][nc][1] = visited[r][c][0] + 1
-                    que.append([nr, nc, 1])
+    start, end = W + 1, n * W + m
+    # fewest[칸]: 지금까지 그 칸에 도착했을 때 부순 벽의 최소 개수(2는 도착한 적 없음)
+    # 거리 순서대로 진행하므로 같은 칸에 같거나 더 많은 벽을 부수고 다시 도착하는 상태는 버린다
+    fewest = bytearray([2]) * size
+    fewest[start] = 0
+
+    frontier = array('i', [start * 2])
+    length = 1
+    while frontier:
+        next_frontier = array('i')
+        for state in frontier:
+            now, h = divmod(state, 2)
+            if now == end:
+                return length
+
+            for move in moves:
+                next_point = now + move
+                # 벽이면 벽을 부수고 진행한다
+                broken = h + space[next_point]
+                if broken < fewest[next_point]:
+                    fewest[next_point] = broken
+                    next_frontier.append(next_point * 2 + broken)
+
+        frontier = next_frontier
+        length += 1
 
     return -1
 
 n, m = map(int, input().split())
-space = [list(map(int, input().rstrip())) for i in range(n)]
-visited = [[[0 for i in range(2)] for j in range(m)] for k in range(n)]
 
-print(bfs())
\ No newline at end of file
+# 지도를 한 줄로 펴고 바깥을 OUT으로 한 칸 둘러싼다
+# (r, c) 칸은 (r + 1) * W + (c + 1)이므로 상하좌우 이동은 ±1, ±W이고
+# 바깥 칸에서 멈추므로 범위 검사가 필요 없다
+W = m + 2
+size = (n + 2) * W
+moves = (1, -1, W, -W)
+space = bytearray([OUT]) * size
+for i in range(n):
+    space[(i + 1) * W + 1:(i + 1) * W + m + 1] = bytes(map(int, input().rstrip()))
+
+print(bfs())
@@ -2,39 +2,66 @@
 # 위상정렬
 
 import sys
-from collections import deque
+from array import array
 input = sys.stdin.readline
 
+
+# 간선 배열을 CSR(compressed sparse row)로 변환
+# offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+def build(n, src, dst):
+    offset = array('i', [0]) * (n + 2)
+    for s in src:
+        offset[s + 1] += 1
+    for v in range(n + 1):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * len(src)
+    pos = offset[:]
+    for s, d in zip(src, dst):
+        target[pos[s]] = d
+        pos[s] += 1
+    return offset, target
+
+
+# 위상 정렬(칸 알고리즘)
+# 진입차수가 0이 된 순서대로 꺼내고, 결과 배열 자체를 큐로 쓴다(head ~ tail 구간이 큐)
+def topological_sort(n, offset, target):
+    deg = array('i', [0]) * (n + 1)
+    for v in target:
+        deg[v] += 1
+
+    order = array('i', [0]) * n
+    head = tail = 0
+    for v in range(1, n + 1):
+        if deg[v] == 0:
+            order[tail] = v
+            tail += 1
+
+    while head < tail:
+        now = order[head]
+        head += 1
+        for i in range(offset[now], offset[now + 1]):
+            next_point = target[i]
+            deg[next_point] -= 1
+            if deg[next_point] == 0:
+                order[tail] = next_point
+                tail += 1
+
+    return order[:tail]
+
+
 n, m = map(int, input().split())
-graph = [[] for i in range(n + 1)]
-chk = [0 for i in range(n + 1)]
-result = list()
-que = deque()
+src = array('i', [0]) * m
+dst = array('i', [0]) * m
 
 # 그래프 정보 추가
-# 추가할 때마다 노드의 진입차수를 1씩 더해준다
+# a가 b 앞에 서야 하므로 a -> b 간선
 for i in range(m):
-    a, b = map(int, input().split())
-    graph[a].append(b)
-    chk[b] += 1
-
-# 진입차수가 0인 노드를 큐에 추가한다
-for i in range(1, n + 1):
-    if chk[i] == 0:
-        que.append(i)
-
-while que:
-    # 큐를 순회하며 원소를 뺄 때마다 결과 리스트에 추가한다
-    temp = que.popleft()
-    result.append(temp)
-
-    # 큐에서 뺀 원소에 연결된 노드를 순회하며
-    # 그 노드의 진입차수를 1씩 빼준다
-    # 그리고 노드의 진입차수가 0이 되었다면
-    # 큐에 추가한다
-    for target in graph[temp]:
-        chk[target] -= 1
-        if chk[target] == 0:
-            que.append(target)
-
-print(*result)
\ No newline at end of file
+    src[i], dst[i] = map(int, input().split())
+
+offset, target = build(n, src, dst)
+
+# 진입차수가 0이 된 학생부터 차례대로 세운다
+result = topological_sort(n, offset, target)
+
+print(*result)
@@ -1,50 +1,60 @@
 # 2638. 치즈
 
-from collections import deque
+from array import array
 
 
-dr = [0, 0, 1, -1]
-dc = [1, -1, 0, 0]
+# 모눈종이 바깥
+OUT = 255
 
 
 def bfs():
-    que = deque()
-    que.append([0, 0])
-    visited[0][0] = True
-    while que:
-        r, c = que.popleft()
-        for i in range(4):
-            nr, nc = r + dr[i], c + dc[i]
-            if (0 <= nr < n) and (0 <= nc < m) and not visited[nr][nc]:
+    visited = bytearray(len(cheese))
+    que[0] = W + 1
+    visited[W + 1] = True
+    head, tail = 0, 1
+    while head < tail:
+        now = que[head]
+        head += 1
+        for move in moves:
+            next_point = now + move
+            if not visited[next_point]:
                 # 바깥 공기
-                if cheese[nr][nc] == 0:
-                    visited[nr][nc] = True
-                    que.append([nr, nc])
+                if cheese[next_point] == 0:
+                    visited[next_point] = True
+                    que[tail] = next_point
+                    tail += 1
                 # 치즈가 바깥 공기에 닿을 때마다 1을 더해준다
                 # 결국 bfs를 한 번 진행했을 때 공기에 닿은 칸의 값은 (변 + 1)이다
-                else:
-                    cheese[nr][nc] += 1
+                elif cheese[next_point] != OUT:
+                    cheese[next_point] += 1
 
 
 n, m = map(int, input().split())
-cheese = [list(map(int, input().split())) for i in range(n)]
+
+# 모눈종이를 한 줄로 펴고 바깥을 OUT으로 한 칸 둘러싼다
+# (r, c) 칸은 (r + 1) * W + (c + 1)이므로 상하좌우 이동은 ±1, ±W이고
+# 바깥 칸에서 멈추므로 범위 검사가 필요 없다
+W = m + 2
+moves = (1, -1, W, -W)
+cheese = bytearray([OUT]) * ((n + 2) * W)
+for i in range(n):
+    cheese[(i + 1) * W + 1:(i + 1) * W + m + 1] = bytes(map(int, input().split()))
+
+# 남은 치즈 칸의 목록
+pieces = [(i + 1) * W + j + 1 for i in range(n) for j in range(m) if cheese[(i + 1) * W + j + 1]]
+# 칸마다 큐에 한 번만 들어가므로 큐는 칸 수만큼 미리 잡아 둔다
+que = array('i', [0]) * len(cheese)
 time = 0
 
 while True:
-    visited = [[False for i in range(m)] for j in range(n)]
-    chk = False
     bfs()
-    for i in range(n):
-        for j in range(m):
-            # 치즈의 두 변 이상에 공기가 닿으면 녹는다
-            if cheese[i][j] > 2:
-                cheese[i][j] = 0
-            # 그 외의 경우에는 다시 1로 되돌린다
-            elif cheese[i][j] > 0:
-                cheese[i][j] = 1
-                chk = True
+    for point in pieces:
+        # 치즈의 두 변 이상에 공기가 닿으면 녹는다
+        # 그 외의 경우에는 다시 1로 되돌린다
+        cheese[point] = 0 if cheese[point] > 2 else 1
+    pieces = [point for point in pieces if cheese[point]]
     time += 1
     # 치즈가 하나도 남지 않으면 break
-    if not chk: break
+    if not pieces: break
 
-print(time)
\ No newline at end of file
+print(time)
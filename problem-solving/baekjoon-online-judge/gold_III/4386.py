@@ -5,44 +5,29 @@ import sys
 input = sys.stdin.readline
 
 
-# find
-def find(s):
-    if s != const[s]:
-        const[s] = find(const[s])
-    return const[s]
+n = int(input())
+stars = [list(map(float, input().split())) for i in range(n)]
+result = 0
 
+# 프림 알고리즘
+# 모든 별 사이의 경로를 만들어 정렬하지 않고,
+# 아직 별자리에 들어가지 않은 별(rest)마다 별자리까지의 가장 짧은 거리(best)만 들고 있는다
+rest = list(range(1, n))
+x, y = stars[0]
+best = [sqrt((stars[i][0] - x) ** 2 + (stars[i][1] - y) ** 2) for i in rest]
 
-# union
-def union(s1, s2):
-    s1, s2 = find(s1), find(s2)
-    if s1 == s2: return True
-    if s1 < s2: const[s2] = s1
-    else: const[s1] = s2
-    return False
+while rest:
+    # 별자리에 가장 가까운 별을 골라 연결하고 결과값에 거리를 더해준다
+    k = min(range(len(best)), key=best.__getitem__)
+    result += best[k]
+    x, y = stars[rest[k]]
 
+    # 고른 별은 맨 뒤의 별과 자리를 바꿔 목록에서 뺀다
+    rest[k], best[k] = rest[-1], best[-1]
+    rest.pop()
+    best.pop()
 
-n = int(input())
-stars = [list(map(float, input().split())) for i in range(n)]
-const = [i for i in range(n)]
-paths = list()
-result = 0
+    # 새로 연결한 별을 거쳐 더 가까워지는 별이 있으면 거리를 줄인다
+    best = [min(b, sqrt((stars[i][0] - x) ** 2 + (stars[i][1] - y) ** 2)) for b, i in zip(best, rest)]
 
-# 별과 별 사이의 경로 길이를 구하고 리스트 paths에
-# 그 길이와 함께 출발점과 도착점을 튜플로 묶어 넣는다
-for i in range(n):
-    for j in range(i + 1, n):
-        distance = sqrt((stars[i][0] - stars[j][0]) ** 2 + (stars[i][1] - stars[j][1]) ** 2)
-        paths.append((distance, i, j))
-
-# 리스트 paths를 경로 기준으로 오름차순 정렬한다
-paths.sort()
-
-# paths를 순회하며 union 함수를 실행한다
-# 반환값이 True이면 이미 연결된 관계이므로 생략,
-# False이면 결과값에 거리를 더해준다
-for dist, start, end in paths:
-    chk = union(start, end)
-    if not chk:
-        result += dist
-
-print(f'{result:.2f}')
\ No newline at end of file
+print(f'{result:.2f}')
@@ -6,43 +6,30 @@ input = sys.stdin.readline
 n = int(input())
 m = int(input())
 
-# weight: [r] > [c]
-# rev_weight: [r] < [c]
-weight = [[int(1e9) for i in range(n)] for j in range(n)]
-rev_weight = [[int(1e9) for i in range(n)] for j in range(n)]
+# heavier[r]의 c번째 비트가 켜져 있으면 [r] > [c]
+# [r] < [c]는 따로 저장하지 않고 heavier[c]의 r번째 비트로 확인한다
+heavier = [0] * n
 
 for i in range(m):
     a, b = map(int, input().split())
-    weight[a - 1][b - 1] = 1
-    rev_weight[b - 1][a - 1] = 1
+    heavier[a - 1] |= 1 << (b - 1)
 
-# 자기 자신 - 자기 자신 쌍의 경우 값이 0
-for i in range(n):
-    weight[i][i] = 0
-    rev_weight[i][i] = 0
-
-# 플로이드-워셜
+# 플로이드-워셜(도달 가능 여부만)
+# j가 i보다 무겁다면 i보다 가벼운 물건은 모두 j보다도 가볍다
 for i in range(n):
+    bit = 1 << i
+    via = heavier[i]
     for j in range(n):
-        for k in range(n):
-            weight[j][k] = min(weight[j][k], weight[j][i] + weight[i][k])
-            rev_weight[j][k] = min(rev_weight[j][k], rev_weight[j][i] + rev_weight[i][k])
+        if heavier[j] & bit:
+            heavier[j] |= via
 
 result = list()
 
 # 비교 결과를 알 수 있는 물건의 개수를 먼저 구한 후
 # 그 값으로 결과를 알 수 없는 물건의 개수를 구한다.
 for i in range(n):
-    chk = 0
-    for j in range(n):
-        if weight[i][j] == int(1e9):
-            weight[i][j] = 0
-        if rev_weight[i][j] == int(1e9):
-            rev_weight[i][j] = 0
-        if weight[i][j]:
-            chk += 1
-        if rev_weight[i][j]:
-            chk += 1
+    chk = bin(heavier[i]).count('1')
+    chk += sum(heavier[j] >> i & 1 for j in range(n))
     result.append(n - chk - 1)
 
-print(*result, sep='\n')
\ No newline at end of file
+print(*result, sep='\n')
@@ -1,37 +1,68 @@
 # 10282. 해킹
 
 import sys, heapq
+from array import array
 input = sys.stdin.readline
+INF = int(1e9)
 
 t = int(input())
 
 for i in range(t):
     n, d, c = map(int, input().split())
-    computer = [[] for j in range(n)]
-    result = [int(1e9) for j in range(n)]
-    result[c - 1] = 0
-    que = [(0, c - 1)]
+    SHIFT = n.bit_length()
+    MASK = (1 << SHIFT) - 1
+
+    # b가 감염되면 s초 뒤 a가 감염되므로 b -> a 간선으로 받는다
+    src = array('i', [0]) * d
+    dst = array('i', [0]) * d
+    cost = array('i', [0]) * d
 
     for j in range(d):
         a, b, s = map(int, input().split())
-        computer[b - 1].append((s, a - 1))
+        src[j], dst[j], cost[j] = b - 1, a - 1, s
+
+    # CSR(compressed sparse row)로 변환
+    # offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+    offset = array('i', [0]) * (n + 1)
+    for s in src:
+        offset[s + 1] += 1
+    for v in range(n):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * d
+    weight = array('i', [0]) * d
+    pos = offset[:]
+    for j in range(d):
+        s = src[j]
+        target[pos[s]] = dst[j]
+        weight[pos[s]] = cost[j]
+        pos[s] += 1
+
+    result = [INF] * n
+    result[c - 1] = 0
+    # 힙에는 (시간 << SHIFT) | 컴퓨터 형태의 정수 하나만 넣는다
+    que = [c - 1]
 
     # 다익스트라
     while que:
-        cost, point = heapq.heappop(que)
+        key = heapq.heappop(que)
+        time, point = key >> SHIFT, key & MASK
+        if result[point] < time: continue
+
+        for j in range(offset[point], offset[point + 1]):
+            next_point = target[j]
+            next_time = time + weight[j]
+            if next_time < result[next_point]:
+                result[next_point] = next_time
+                heapq.heappush(que, next_time << SHIFT | next_point)
 
-        for next_cost, next_point in computer[point]:
-            if cost + next_cost < result[next_point]:
-                result[next_point] = cost + next_cost
-                heapq.heappush(que, (cost + next_cost, next_point))
-    
     time = 0
     cnt = 0
 
     # 감염되는 컴퓨터의 수와 마지막 컴퓨터가 감염되기까지 걸리는 시간 구하기
     for j in range(n):
-        if result[j] != int(1e9):
+        if result[j] != INF:
             time = max(time, result[j])
             cnt += 1
-    
-    print(cnt, time)
\ No newline at end of file
+
+    print(cnt, time)
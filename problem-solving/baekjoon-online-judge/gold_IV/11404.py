@@ -17,10 +17,14 @@ for i in range(n):
     bus[i][i] = 0
 
 # 플로이드-워셜
+# 경유 도시 i에 대해 j행 전체를 i행과 한 번에 비교해 새 행으로 바꾼다
+# j에서 i로 갈 수 없으면 그 행은 바뀔 일이 없으므로 건너뛴다
 for i in range(n):
+    via = bus[i]
     for j in range(n):
-        for k in range(n):
-            bus[j][k] = min(bus[j][k], bus[j][i] + bus[i][k])
+        cost = bus[j][i]
+        if cost == int(1e9): continue
+        bus[j] = [a if a <= cost + b else cost + b for a, b in zip(bus[j], via)]
 
 # 갈 수 없는 경우: 0으로 변경해준다
 for i in range(n):
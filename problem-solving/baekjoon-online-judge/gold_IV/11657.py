@@ -1,22 +1,42 @@
 import sys
+from array import array
+from itertools import compress
+from operator import add, lt
 input = sys.stdin.readline
-INF = sys.maxsize
+# 갈 수 없는 도시는 INF + cost도 INF로 남아야 하므로 float('inf')를 쓴다
+INF = float('inf')
 
 # 벨만-포드
+# 한 번 순회할 때 모든 노선의 (출발 도시까지의 시간 + 걸리는 시간)을 한꺼번에 계산하고
+# 도착 도시의 값보다 작아지는 노선만 골라 갱신한다
+# 한 번 순회하는 동안 값이 하나도 바뀌지 않았다면 이후에도 바뀌지 않으므로 바로 끝낸다
 def bellman_ford(start):
     route[start - 1] = 0
     for i in range(n):
-        for j in range(m):
-            point, next_point, cost = bus[j]
-            if route[point - 1] != INF and route[point - 1] + cost < route[next_point - 1]:
-                route[next_point - 1] = route[point - 1] + cost
-                # (n - 1)번 돌고 난 후에도 값에 변화가 생긴다면 음수 사이클이 존재한다는 뜻
-                if i == n - 1:
-                    return True
+        time = list(map(add, map(route.__getitem__, src), cost))
+        better = list(compress(range(m), map(lt, time, map(route.__getitem__, dst))))
+        if not better:
+            break
+        # (n - 1)번 돌고 난 후에도 값에 변화가 생긴다면 음수 사이클이 존재한다는 뜻
+        if i == n - 1:
+            return True
+        # 같은 도시로 가는 노선이 여럿이면 가장 작은 값만 남긴다
+        for j in better:
+            if time[j] < route[dst[j]]:
+                route[dst[j]] = time[j]
     return False
 
 n, m = map(int, input().split())
-bus = [list(map(int, input().split())) for i in range(m)]
+
+# 노선을 출발 도시, 도착 도시, 걸리는 시간 배열 세 개로 나눠 저장한다
+src = array('i', [0]) * m
+dst = array('i', [0]) * m
+cost = array('i', [0]) * m
+
+for i in range(m):
+    a, b, c = map(int, input().split())
+    src[i], dst[i], cost[i] = a - 1, b - 1, c
+
 route = [INF for i in range(n)]
 
 negative = bellman_ford(1)
@@ -28,4 +48,4 @@ else:
     # 아니면 해당 도시로 가는 가장 빠른 시간을 출력한다
     for i in range(1, n):
         if route[i] == INF: print(-1)
-        else: print(route[i])
\ No newline at end of file
+        else: print(route[i])
@@ -2,37 +2,86 @@
 # 크루스칼 알고리즘: 가장 적은 비용으로 모든 노드를 연결한다
 
 import heapq, sys
+from array import array
 input = sys.stdin.readline
 
 
 # 유니온 파인드
-def find(p):
-    if p != chk[p]:
-        chk[p] = find(chk[p])
-    return chk[p]
+# 부모와 집합 크기를 array에 저장한다
+class DisjointSet:
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
 
+    # find 연산
+    # 재귀 대신 한 칸 건너뛴 조상을 가리키게 하면서(경로 절반 압축) 루트까지 올라간다
+    def find(self, p):
+        parent = self.parent
+        while p != parent[p]:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
 
-def union(p1, p2):
-    p1, p2 = find(p1), find(p2)
+    # union 연산
+    # 크기가 작은 집합을 큰 집합 밑에 붙이고, 새로 합쳐졌으면 True를 반환한다
+    def union(self, p1, p2):
+        p1, p2 = self.find(p1), self.find(p2)
+        if p1 == p2: return False
+        if self.size[p1] < self.size[p2]: p1, p2 = p2, p1
+        self.parent[p2] = p1
+        self.size[p1] += self.size[p2]
+        return True
 
-    if p1 == p2: return
-    if p1 < p2: chk[p2] = p1
-    else: chk[p1] = p2
+
+# 계수 정렬
+# 가중치 범위가 간선 수보다 좁으면 비교 정렬 대신 가중치별 개수로 간선 번호를 나열한다
+def counting_sort(cost, low, high):
+    count = array('i', [0]) * (high - low + 2)
+    for c in cost:
+        count[c - low + 1] += 1
+    for i in range(high - low + 1):
+        count[i + 1] += count[i]
+
+    order = array('i', [0]) * len(cost)
+    for i, c in enumerate(cost):
+        order[count[c - low]] = i
+        count[c - low] += 1
+    return order
+
+
+# 크루스칼 알고리즘
+# 간선을 직접 정렬하지 않고 가중치 순서대로 간선 번호만 정렬한다
+# 가중치가 가장 작은 간선부터 연결하고, n - 1개를 골랐으면 남은 간선은 보지 않는다
+# 최소 스패닝 트리의 가중치 합을 반환한다
+def kruskal(n, src, dst, cost):
+    if not cost: return 0
+    low, high = min(cost), max(cost)
+    if high - low <= len(cost):
+        order = counting_sort(cost, low, high)
+    else:
+        order = sorted(range(len(cost)), key=cost.__getitem__)
+
+    dsu = DisjointSet(n + 1)
+    total = picked = 0
+    for i in order:
+        if dsu.union(src[i], dst[i]):
+            total += cost[i]
+            picked += 1
+            if picked == n - 1: break
+    return total
 
 
 v, e = map(int, input().split())
-graph = [list(map(int, input().split())) for i in range(e)]
-# 가중치를 기준으로 오름차순 정렬한다
-graph.sort(key=lambda x:x[2])
-chk = [i for i in range(v + 1)]
-result = 0
+# 간선 정보를 출발점, 도착점, 가중치 배열 세 개로 나눠 저장한다
+src = array('i', [0]) * e
+dst = array('i', [0]) * e
+cost = array('i', [0]) * e
+for i in range(e):
+    src[i], dst[i], cost[i] = map(int, input().split())
 
 # 가중치가 가장 작은 간선부터 간선 정보를 사용하여 노드를 연결한다
 # 노드를 연결할 때에는 유니온 파인드 알고리즘을 사용하며,
 # 유니온 연산을 할 때마다 결과값 변수에 가중치를 더한다
-for a, b, c in graph:
-    if find(a) != find(b):
-        union(a, b)
-        result += c
+result = kruskal(v, src, dst, cost)
 
 print(result)
\ No newline at end of file
@@ -3,40 +3,100 @@
 # 바너버스(구 번역 바르나바) 태피스트리 앞 필요의 방에서 D.A. 모임을 가진다
 # 엄브릿지 너무 싫다
 
-import sys
+import sys, heapq
+from array import array
+from operator import add
 input = sys.stdin.readline
 INF = sys.maxsize
 
-t = int(input())
-
-for i in range(t):
-    n, m = map(int, input().split())
+# 플로이드-워셜
+# 경유지 j에 대해 k행 전체를 한 번에 갱신하고, j로 가는 길이 없는 행은 건너뛴다
+def floyd():
     way = [[INF for j in range(n)] for k in range(n)]
 
     # 양방향 경로
-    for j in range(m):
-        a, b, c = map(int, input().split())
-        way[a - 1][b - 1] = c
-        way[b - 1][a - 1] = c
+    for a, b, c in edges:
+        way[a][b] = way[b][a] = min(way[a][b], c)
 
     # 한 지점에서 그 지점으로 가는 데에는 비용이 필요하지 않다
     for j in range(n):
         way[j][j] = 0
 
-    # 플로이드-워셜
     for j in range(n):
+        via = way[j]
         for k in range(n):
-            for l in range(n):
-                if way[k][j] + way[j][l] < way[k][l]:
-                    way[k][l] = way[k][j] + way[j][l]
+            cost = way[k][j]
+            if cost == INF: continue
+            way[k] = [a if a <= cost + b else cost + b for a, b in zip(way[k], via)]
+
+    return way
+
+# 다익스트라
+# 요청받은 방마다 CSR 그래프 위의 다익스트라를 돌려 거리 한 줄씩 내보낸다
+def dijkstra_rows(sources):
+    offset = array('i', [0]) * (n + 1)
+    for a, b, c in edges:
+        offset[a + 1] += 1
+        offset[b + 1] += 1
+    for v in range(n):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * (2 * m)
+    weight = array('i', [0]) * (2 * m)
+    pos = offset[:]
+    for a, b, c in edges:
+        target[pos[a]], weight[pos[a]] = b, c
+        target[pos[b]], weight[pos[b]] = a, c
+        pos[a] += 1
+        pos[b] += 1
+
+    # 힙에는 (거리 << SHIFT) | 방 형태의 정수 하나만 넣는다
+    SHIFT = n.bit_length()
+    MASK = (1 << SHIFT) - 1
+    for start in sources:
+        row = [INF] * n
+        row[start] = 0
+        que = [start]
+        while que:
+            key = heapq.heappop(que)
+            cost, point = key >> SHIFT, key & MASK
+            if row[point] < cost: continue
+            for j in range(offset[point], offset[point + 1]):
+                next_point = target[j]
+                next_cost = cost + weight[j]
+                if next_cost < row[next_point]:
+                    row[next_point] = next_cost
+                    heapq.heappush(que, next_cost << SHIFT | next_point)
+        yield row
+
+# sources에 있는 방마다 다른 모든 방까지의 거리를 한 줄씩 내보낸다
+# 회원이 있는 방에서만 다익스트라((n + 2m)log n씩)를 돌리는 것이 플로이드-워셜(n^3)보다 빠르면 다익스트라를 쓴다
+# 이 경우 거리 행렬 전체를 들고 있지 않는다
+def distances(sources):
+    if len(sources) * (n + 2 * m) * n.bit_length() < n * n * n:
+        yield from dijkstra_rows(sources)
+    else:
+        way = floyd()
+        for start in sources:
+            yield way[start]
+
+t = int(input())
+
+for i in range(t):
+    n, m = map(int, input().split())
+    edges = list()
+
+    for j in range(m):
+        a, b, c = map(int, input().split())
+        edges.append((a - 1, b - 1, c))
 
     k = int(input())
     member = list(map(int, input().split()))
     result = [0 for j in range(n)]
 
     # D.A. 회원들의 이동 거리의 총합이 최소가 되는 장소 찾기
-    for j in range(k):
-        for l in range(n):
-            result[l] += way[member[j] - 1][l]
+    # 회원이 있는 방에서 구한 거리를 한 줄씩 바로 더해 나간다
+    for row in distances([j - 1 for j in member]):
+        result = list(map(add, result, row))
 
-    print(result.index(min(result)) + 1)
\ No newline at end of file
+    print(result.index(min(result)) + 1)
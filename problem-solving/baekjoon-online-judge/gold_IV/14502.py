@@ -1,63 +1,61 @@
 # 14502. 연구소
 
-from collections import deque
-from copy import deepcopy
+from array import array
+from itertools import combinations
 import sys
 
-# 벽 세 개 세우고 BFS
-def wall(wall_cnt):
-    if wall_cnt == 3:
-        bfs()
-        return
+# BFS
+# 바이러스가 퍼진 빈 칸의 수를 반환한다
+# 지금까지 가장 적게 퍼진 경우(limit)만큼 퍼지면 더 볼 필요가 없으므로 그대로 멈춘다
+def bfs(limit):
+    head, tail = 0, len(virus)
+    que[:tail] = virus
 
-    for i in range(n):
-        for j in range(m):
-            if not original_map[i][j]:
-                original_map[i][j] = 1
-                wall(wall_cnt + 1)
-                original_map[i][j] = 0
+    while head < tail:
+        now = que[head]
+        head += 1
 
-# BFS
-def bfs():
-    wall_map = deepcopy(original_map)
-    que = deque()
-
-    for i in range(n):
-        for j in range(m):
-            if wall_map[i][j] == 2:
-                que.append((i, j))
-    
-    while que:
-        r, c = que.popleft()
-
-        for i in range(4):
-            nr = r + dr[i]
-            nc = c + dc[i]
-
-            if (0 <= nr < n) and (0 <= nc < m) and not wall_map[nr][nc]:
-                wall_map[nr][nc] = 2
-                que.append((nr, nc))
-    
-    global result
-    cnt = 0
-
-    # BFS를 수행할 때마다 바이러스로부터 안전한 구역의 수를 센 후 그 이전 값과 비교해 큰 값으로 유지
-    for i in range(n):
-        for j in range(m):
-            if not wall_map[i][j]:
-                cnt += 1
-    
-    result = max(cnt, result)
-
-dr = [0, 0, -1, 1]
-dc = [1, -1, 0, 0]
+        for move in moves:
+            next_point = now + move
+
+            if not wall_map[next_point]:
+                wall_map[next_point] = 2
+                que[tail] = next_point
+                tail += 1
+
+        if tail - len(virus) >= limit:
+            break
+
+    return tail - len(virus)
 
 n, m = map(int, sys.stdin.readline().split())
-original_map = [[] for i in range(n)]
-result = 0
 
-for i in range(n):
-    original_map[i] = list(map(int, sys.stdin.readline().split()))
+# 연구소를 한 줄로 펴고 바깥을 벽(1)으로 한 칸 둘러싼다
+# (r, c) 칸은 (r + 1) * W + (c + 1)이므로 상하좌우 이동은 ±1, ±W이고
+# 바깥 칸에서 멈추므로 범위 검사가 필요 없다
+W = m + 2
+moves = (1, -1, W, -W)
+original_map = bytearray([1]) * ((n + 2) * W)
 
-wall(0)
-print(result)
\ No newline at end of file
+for i in range(n):
+    original_map[(i + 1) * W + 1:(i + 1) * W + m + 1] = bytes(map(int, sys.stdin.readline().split()))
+
+# 빈 칸과 바이러스의 위치는 한 번만 구해 둔다
+empty = [point for point in range(len(original_map)) if original_map[point] == 0]
+virus = array('i', [point for point in range(len(original_map)) if original_map[point] == 2])
+
+# BFS마다 새로 만들지 않고 원본을 덮어써서 다시 쓰는 지도와 큐
+# 칸마다 큐에 한 번만 들어가므로 큐는 칸 수만큼 미리 잡아 둔다
+wall_map = bytearray(len(original_map))
+que = array('i', [0]) * (len(empty) + len(virus))
+
+# 빈 칸 중 세 칸을 골라 벽을 세우고 BFS
+# 안전 영역이 가장 크다는 것은 바이러스가 퍼진 빈 칸이 가장 적다는 것이다
+spread = len(empty)
+for walls in combinations(empty, 3):
+    wall_map[:] = original_map
+    for point in walls:
+        wall_map[point] = 1
+    spread = min(spread, bfs(spread))
+
+print(len(empty) - 3 - spread)
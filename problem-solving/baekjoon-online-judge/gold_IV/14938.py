@@ -1,33 +1,90 @@
 # 14938. 서강그라운드
 
-import sys
+import sys, heapq
+from array import array
 input = sys.stdin.readline
+INF = int(1e9)
+
+# 플로이드-워셜
+# 경유 지역 i에 대해 j행 전체를 한 번에 갱신하고, i로 가는 길이 없는 행은 건너뛴다
+def floyd():
+    field = [[INF for i in range(n)] for j in range(n)]
+    for a, b, l in edges:
+        field[a][b] = field[b][a] = min(field[a][b], l)
+    for i in range(n):
+        field[i][i] = 0
+
+    for i in range(n):
+        via = field[i]
+        for j in range(n):
+            cost = field[j][i]
+            if cost == INF: continue
+            field[j] = [a if a <= cost + b else cost + b for a, b in zip(field[j], via)]
+
+    return field
+
+# 다익스트라
+# 요청받은 시작 지역마다 CSR 그래프 위의 다익스트라를 돌려 거리 한 줄씩 내보낸다
+def dijkstra_rows(sources):
+    offset = array('i', [0]) * (n + 1)
+    for a, b, l in edges:
+        offset[a + 1] += 1
+        offset[b + 1] += 1
+    for v in range(n):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * (2 * len(edges))
+    weight = array('i', [0]) * (2 * len(edges))
+    pos = offset[:]
+    for a, b, l in edges:
+        target[pos[a]], weight[pos[a]] = b, l
+        target[pos[b]], weight[pos[b]] = a, l
+        pos[a] += 1
+        pos[b] += 1
+
+    # 힙에는 (거리 << SHIFT) | 지역 형태의 정수 하나만 넣는다
+    SHIFT = n.bit_length()
+    MASK = (1 << SHIFT) - 1
+    for start in sources:
+        row = [INF] * n
+        row[start] = 0
+        que = [start]
+        while que:
+            key = heapq.heappop(que)
+            length, point = key >> SHIFT, key & MASK
+            if row[point] < length: continue
+            for i in range(offset[point], offset[point + 1]):
+                next_point = target[i]
+                next_length = length + weight[i]
+                if next_length < row[next_point]:
+                    row[next_point] = next_length
+                    heapq.heappush(que, next_length << SHIFT | next_point)
+        yield row
+
+# sources에 있는 지역마다 다른 모든 지역까지의 거리를 한 줄씩 내보낸다
+# 길이 적어 다익스트라 n번((n + 2r)log n씩)이 플로이드-워셜(n^2씩)보다 빠르면 다익스트라를 쓴다
+# 이 경우 거리 행렬 전체를 들고 있지 않고 한 줄을 다 쓰면 버린다
+def distances(sources):
+    if (n + 2 * r) * n.bit_length() < n * n:
+        yield from dijkstra_rows(sources)
+    else:
+        field = floyd()
+        for start in sources:
+            yield field[start]
 
 n, m, r = map(int, input().split())
-field = [[int(1e9) for i in range(n)] for j in range(n)]
 t = list(map(int, input().split()))
 result = 0
 
 # 경로 입력
+edges = list()
 for i in range(r):
-    r, b, l = map(int, input().split())
-    field[r - 1][b - 1] = field[b - 1][r - 1] = l
-
-for i in range(n):
-    field[i][i] = 0
-
-# 플로이드-워셜
-for i in range(n):
-    for j in range(n):
-        for k in range(n):
-            field[j][k] = min(field[j][k], field[j][i] + field[i][k])
+    a, b, l = map(int, input().split())
+    edges.append((a - 1, b - 1, l))
 
 # 각 시작위치마다 그 위치로부터 수색범위인 m까지 갈 수 있는 구역에 있는 아이템의 수를 구한다
-for i in range(n):
-    chk = 0
-    for j in range(n):
-        if field[i][j] <= m:
-            chk += t[j]
+for row in distances(range(n)):
+    chk = sum(item for item, length in zip(t, row) if length <= m)
     result = max(result, chk)
 
-print(result)
\ No newline at end of file
+print(result)
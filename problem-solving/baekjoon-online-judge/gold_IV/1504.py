@@ -1,47 +1,79 @@
 # 1504. 특정한 최단 경로
 
 import sys, heapq
+from array import array
 input = sys.stdin.readline
 
 # 다익스트라
-def dijkstra(start):
-    distance = [int(1e9) for i in range(n + 1)]
+# 여러 출발지를 힙 하나로 한 번에 처리한다
+# k번째 출발지의 거리는 distance[k * (n + 1) + v]에 담긴다
+# 힙에는 (거리 << SHIFT) | 인덱스 형태의 정수 하나만 넣는다
+def dijkstra(sources):
+    size = n + 1
+    distance = array('i', [INF]) * (len(sources) * size)
     que = list()
-    heapq.heappush(que, (0, start))
-    distance[start] = 0
+    for k, start in enumerate(sources):
+        distance[k * size + start] = 0
+        que.append(k * size + start)
+    heapq.heapify(que)
 
     while que:
-        length, point = heapq.heappop(que)
+        key = heapq.heappop(que)
+        length, index = key >> SHIFT, key & MASK
 
-        if length > distance[point]: continue
-        for element in graph[point]:
-            next_length, next_point = element
-            if length + next_length < distance[next_point]:
-                distance[next_point] = length + next_length
-                heapq.heappush(que, (length + next_length, next_point))
-    
-    return distance
+        if length > distance[index]: continue
+        point = index % size
+        base = index - point
+        for i in range(offset[point], offset[point + 1]):
+            next_index = base + target[i]
+            next_length = length + weight[i]
+            if next_length < distance[next_index]:
+                distance[next_index] = next_length
+                heapq.heappush(que, next_length << SHIFT | next_index)
+
+    return [distance[k * size:(k + 1) * size] for k in range(len(sources))]
 
 n, e = map(int, input().split())
-graph = [[] for i in range(n + 1)]
+INF = int(1e9)
+# 출발지 3개의 거리를 한 배열에 담으므로 인덱스는 3 * (n + 1)보다 작다
+SHIFT = (3 * (n + 1)).bit_length()
+MASK = (1 << SHIFT) - 1
 
 # 경로 정보 입력
-# 도착지와 거리를 묶을 때 거리 c가 앞으로 와야한다
 # 양방향 간선이므로 양쪽 모두 간선 정보를 입력한다
+src = array('i', [0]) * (2 * e)
+dst = array('i', [0]) * (2 * e)
+cost = array('i', [0]) * (2 * e)
+
 for i in range(e):
     a, b, c = map(int, input().split())
-    graph[a].append((c, b))
-    graph[b].append((c, a))
+    src[2 * i], dst[2 * i], cost[2 * i] = a, b, c
+    src[2 * i + 1], dst[2 * i + 1], cost[2 * i + 1] = b, a, c
+
+# CSR(compressed sparse row)로 변환
+# offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+offset = array('i', [0]) * (n + 2)
+for s in src:
+    offset[s + 1] += 1
+for v in range(n + 1):
+    offset[v + 1] += offset[v]
+
+target = array('i', [0]) * (2 * e)
+weight = array('i', [0]) * (2 * e)
+pos = offset[:]
+for i in range(2 * e):
+    s = src[i]
+    target[pos[s]] = dst[i]
+    weight[pos[s]] = cost[i]
+    pos[s] += 1
 
 one, two = map(int, input().split())
 
-# 출발지, 경유지1, 경유지2에서 함수를 사용한다
-front = dijkstra(1)
-middle = dijkstra(one)
-back = dijkstra(two)
+# 출발지, 경유지1, 경유지2에서 한 번에 함수를 사용한다
+front, middle, back = dijkstra([1, one, two])
 
 # 출발지 ~ 경유지1, 경유지1 ~ 경유지2, 경유지2 ~ 도착지 중 어느 하나라도 경로가 존재하지 않는 경우
-if front[one] == int(1e9) or middle[two] == int(1e9) or back[n] == int(1e9):
+if front[one] == INF or middle[two] == INF or back[n] == INF:
     print(-1)
 else:
     # (출발지 ~ 경유지2) + (경유지2 ~ 경유지1) + (경유지1 ~ 도착지)가 더 빠른 경우
@@ -49,4 +81,4 @@ else:
         print(front[two] + middle[two] + middle[n])
     # (출발지 ~ 경유지1) + (경유지1 ~ 경유지2) + (경유지2 ~ 도착지)가 더 빠른 경우
     else:
-        print(front[one] + middle[two] + back[n])
\ No newline at end of file
+        print(front[one] + middle[two] + back[n])
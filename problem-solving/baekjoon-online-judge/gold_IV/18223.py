@@ -1,38 +1,73 @@
 # 18223. 민준이와 마산 그리고 건우
 
 import sys, heapq
+from array import array
 input = sys.stdin.readline
 INF = sys.maxsize
 
-def dijkstra(start):
-    result = [INF for i in range(v)]
-    result[start] = 0
-    que = [(0, start)]
+# 여러 출발지를 힙 하나로 한 번에 처리한다
+# k번째 출발지의 거리는 result[k * v + u]에 담긴다
+# 힙에는 (거리 << SHIFT) | 인덱스 형태의 정수 하나만 넣는다
+def dijkstra(sources):
+    result = array('q', [INF]) * (len(sources) * v)
+    que = list()
+    for k, start in enumerate(sources):
+        result[k * v + start] = 0
+        que.append(k * v + start)
+    heapq.heapify(que)
     while que:
-        cost, point = heapq.heappop(que)
-        if result[point] < cost: continue
-        for next_cost, next_point in graph[point]:
-            if cost + next_cost < result[next_point]:
-                result[next_point] = cost + next_cost
-                heapq.heappush(que, (cost + next_cost, next_point))
-    return result
+        key = heapq.heappop(que)
+        cost, index = key >> SHIFT, key & MASK
+        if result[index] < cost: continue
+        point = index % v
+        base = index - point
+        for i in range(offset[point], offset[point + 1]):
+            next_index = base + target[i]
+            next_cost = cost + weight[i]
+            if next_cost < result[next_index]:
+                result[next_index] = next_cost
+                heapq.heappush(que, next_cost << SHIFT | next_index)
+    return [result[k * v:(k + 1) * v] for k in range(len(sources))]
 
 v, e, p = map(int, input().split())
-graph = [[] for i in range(v)]
+# 출발지 2개의 거리를 한 배열에 담으므로 인덱스는 2 * v보다 작다
+SHIFT = (2 * v).bit_length()
+MASK = (1 << SHIFT) - 1
+
+# 양방향 간선이므로 양쪽 모두 간선 정보를 입력한다
+src = array('i', [0]) * (2 * e)
+dst = array('i', [0]) * (2 * e)
+cost = array('i', [0]) * (2 * e)
 
 for i in range(e):
     a, b, c = map(int, input().split())
-    graph[a - 1].append((c, b - 1))
-    graph[b - 1].append((c, a - 1))
+    src[2 * i], dst[2 * i], cost[2 * i] = a - 1, b - 1, c
+    src[2 * i + 1], dst[2 * i + 1], cost[2 * i + 1] = b - 1, a - 1, c
+
+# CSR(compressed sparse row)로 변환
+# offset[u] ~ offset[u + 1] 구간이 u에서 나가는 간선
+offset = array('i', [0]) * (v + 1)
+for s in src:
+    offset[s + 1] += 1
+for u in range(v):
+    offset[u + 1] += offset[u]
+
+target = array('i', [0]) * (2 * e)
+weight = array('i', [0]) * (2 * e)
+pos = offset[:]
+for i in range(2 * e):
+    s = src[i]
+    target[pos[s]] = dst[i]
+    weight[pos[s]] = cost[i]
+    pos[s] += 1
 
-# 출발지점과 각 지점 사이의 최단 거리 구하기
-one = dijkstra(0)
-# 건우가 있는 지점부터 각 지점 사이의 최단 거리 구하기
-two = dijkstra(p - 1)
+# 출발지점과 각 지점 사이의 최단 거리(one),
+# 건우가 있는 지점부터 각 지점 사이의 최단 거리(two)를 한 번에 구하기
+one, two = dijkstra([0, p - 1])
 
 # 최단경로로 움직일 때 건우가 있는 지점을 지난다면 SAVE HIM
 if one[p - 1] + two[-1] == one[-1]:
     print('SAVE HIM')
 # 지나지 않는다면 GOOD BYE
 else:
-    print('GOOD BYE')
\ No newline at end of file
+    print('GOOD BYE')
@@ -1,36 +1,55 @@
 # 20040. 사이클 게임
 
 import sys
+from array import array
 input = sys.stdin.readline
 
 
-def find(p):
-    if p != chk[p]:
-        chk[p] = find(chk[p])
-    return chk[p]
+# 유니온 파인드
+# 부모와 집합 크기를 array에 저장한다
+class DisjointSet:
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+
+    # find 연산
+    # 재귀 대신 한 칸 건너뛴 조상을 가리키게 하면서(경로 절반 압축) 루트까지 올라간다
+    def find(self, p):
+        parent = self.parent
+        while p != parent[p]:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    # union 연산
+    # 크기가 작은 집합을 큰 집합 밑에 붙이고, 새로 합쳐졌으면 True를 반환한다
+    def union(self, p1, p2):
+        p1, p2 = self.find(p1), self.find(p2)
+        if p1 == p2: return False
+        if self.size[p1] < self.size[p2]: p1, p2 = p2, p1
+        self.parent[p2] = p1
+        self.size[p1] += self.size[p2]
+        return True
 
 
-def union(p1, p2):
-    p1, p2 = find(p1), find(p2)
-    if p1 == p2:
-        return True
-    if p1 < p2: chk[p2] = p1
-    else: chk[p1] = p2
-    return False
+# 입력에서 간선을 하나씩 읽어 내보낸다
+def read_edges(m):
+    for i in range(m):
+        yield map(int, input().split())
+
+
+# 간선을 받는 대로 유니온 연산을 한다
+# 이미 연결된 두 점을 잇는 간선이 나오면 사이클이 생긴 것이므로
+# 그 차례를 바로 반환하고 남은 간선은 읽지 않는다
+# 끝까지 사이클이 생기지 않으면 0을 반환한다
+def first_cycle(dsu, edges):
+    for i, (a, b) in enumerate(edges, 1):
+        if not dsu.union(a, b):
+            return i
+    return 0
 
 
 n, m = map(int, input().split())
-chk = [i for i in range(n)]
-result = -1
-
-for i in range(m):
-    a, b = map(int, input().split())
-    # 유니온 연산을 한다
-    # 이미 연결이 된 경우 True, 아닌 경우 False 반환
-    flag = union(a, b)
-    # 이미 연결이 되어 있었으며 결과값이 한 번도 바뀐 적이 없을 때
-    # 결과값을 구한다
-    if flag and result == -1:
-        result = i + 1
-
-print(0 if result == -1 else result)
\ No newline at end of file
+dsu = DisjointSet(n)
+
+print(first_cycle(dsu, read_edges(m)))
@@ -1,69 +1,61 @@
 # 2573. 빙산
 
-from collections import deque
-from copy import deepcopy
+from array import array
 import sys
 input = sys.stdin.readline
 
 
-dr = [0, 0, -1, 1]
-dc = [1, -1, 0, 0]
-
-
-# 배열을 순회하며 빙산의 높이를 갱신하고
-# 최종 결과를 다시 배열에 저장한다
+# 빙산마다 닿은 바다의 수를 먼저 모두 센 다음
+# 한꺼번에 높이를 갱신하고 남은 빙산의 목록을 돌려준다
 def melt(targets):
-    global maps
-
-    result = deepcopy(maps)
-    for row, col in targets:
-        que = deque([(row, col)])
-        while que:
-            r, c = que.popleft()
-            cnt = 0
-            for i in range(4):
-                nr, nc = r + dr[i], c + dc[i]
-                if (0 <= nr < n) and (0 <= nc < m) and not maps[nr][nc]:
-                    cnt += 1
-            if cnt:
-                result[r][c] -= cnt
-                if result[r][c] < 0: result[r][c] = 0
+    sea = [(not maps[point + 1]) + (not maps[point - 1]) + (not maps[point + W]) + (not maps[point - W])
+           for point in targets]
+    for point, cnt in zip(targets, sea):
+        maps[point] = max(maps[point] - cnt, 0)
 
-    maps = result
+    return [point for point in targets if maps[point]]
 
 
 n, m = map(int, input().split())
-maps = [list(map(int, input().split())) for i in range(n)]
+
+# 지도를 한 줄로 펴고 바깥을 바다(0)로 한 칸 둘러싼다
+# (r, c) 칸은 (r + 1) * W + (c + 1)이므로 상하좌우 이동은 ±1, ±W이고
+# 바다에서는 BFS가 멈추므로 범위 검사가 필요 없다
+W = m + 2
+moves = (1, -1, W, -W)
+maps = bytearray((n + 2) * W)
+for i in range(n):
+    maps[(i + 1) * W + 1:(i + 1) * W + m + 1] = bytes(map(int, input().split()))
+
+glacier = [point for point in range(len(maps)) if maps[point]]
+# 칸마다 큐에 한 번만 들어가므로 큐는 칸 수만큼 미리 잡아 둔다
+que = array('i', [0]) * len(maps)
 time = 0
 
 # 빙산이 두 덩어리 이상으로 분리되거나 다 녹을 때까지 반복해서
 # 빙산의 개수를 세고 시간을 더하고 빙산의 높이를 갱신한다
 while True:
-    glacier = list()
-    que = deque()
-    visited = [[False for i in range(m)] for j in range(n)]
-    chk = 0
-    for i in range(n):
-        for j in range(m):
-            if maps[i][j]:
-                glacier.append((i, j))
-                if not visited[i][j]:
-                    que.append((i, j))
-                    visited[i][j] = True
-                    while que:
-                        r, c = que.popleft()
-                        for k in range(4):
-                            nr, nc = r + dr[k], c + dc[k]
-                            if (0 <= nr < n) and (0 <= nc < m):
-                                if not visited[nr][nc] and maps[nr][nc]:
-                                    visited[nr][nc] = True
-                                    que.append((nr, nc))
-                    chk += 1
     if not glacier:
         print(0)
         break
-    if chk > 1:
+
+    # 아무 빙산에서나 BFS를 해서 닿지 않는 빙산이 있으면 두 덩어리 이상이다
+    visited = bytearray(len(maps))
+    que[0] = glacier[0]
+    visited[glacier[0]] = True
+    head, tail = 0, 1
+    while head < tail:
+        now = que[head]
+        head += 1
+        for move in moves:
+            next_point = now + move
+            if not visited[next_point] and maps[next_point]:
+                visited[next_point] = True
+                que[tail] = next_point
+                tail += 1
+
+    if tail < len(glacier):
         print(time)
         break
     time += 1
-    melt(glacier)
\ No newline at end of file
+    glacier = melt(glacier)
@@ -1,30 +1,33 @@
 # 2636. 치즈
 
-from collections import deque
+from array import array
 
 
-dr = [0, 0, 1, -1]
-dc = [1, -1, 0, 0]
+# 판 바깥
+OUT = 2
 
 
 def bfs():
-    que = deque()
-    que.append([0, 0])
-    visited[0][0] = True
+    visited = bytearray(len(cheese))
+    que[0] = W + 1
+    visited[W + 1] = True
+    head, tail = 0, 1
     cnt = 0
-    while que:
-        r, c = que.popleft()
-        for i in range(4):
-            nr, nc = r + dr[i], c + dc[i]
-            if (0 <= nr < n) and (0 <= nc < m) and not visited[nr][nc]:
+    while head < tail:
+        now = que[head]
+        head += 1
+        for move in moves:
+            next_point = now + move
+            if not visited[next_point]:
                 # 바깥 공기
-                if cheese[nr][nc] == 0:
-                    visited[nr][nc] = True
-                    que.append([nr, nc])
+                if cheese[next_point] == 0:
+                    visited[next_point] = True
+                    que[tail] = next_point
+                    tail += 1
                 # 바깥 공기와 닿은 치즈
-                else:
-                    visited[nr][nc] = True
-                    cheese[nr][nc] = 0
+                elif cheese[next_point] == 1:
+                    visited[next_point] = True
+                    cheese[next_point] = 0
                     cnt += 1
     # 치즈 조각이 놓여있는 칸의 개수
     cnts.append(cnt)
@@ -32,12 +35,22 @@ def bfs():
 
 
 n, m = map(int, input().split())
-cheese = [list(map(int, input().split())) for i in range(n)]
+
+# 판을 한 줄로 펴고 바깥을 OUT으로 한 칸 둘러싼다
+# (r, c) 칸은 (r + 1) * W + (c + 1)이므로 상하좌우 이동은 ±1, ±W이고
+# 바깥 칸에서 멈추므로 범위 검사가 필요 없다
+W = m + 2
+moves = (1, -1, W, -W)
+cheese = bytearray([OUT]) * ((n + 2) * W)
+for i in range(n):
+    cheese[(i + 1) * W + 1:(i + 1) * W + m + 1] = bytes(map(int, input().split()))
+
+# 칸마다 큐에 한 번만 들어가므로 큐는 칸 수만큼 미리 잡아 둔다
+que = array('i', [0]) * len(cheese)
 cnts = list()
 time = 0
 
 while True:
-    visited = [[False for i in range(m)] for j in range(n)]
     cnt = bfs()
     # 치즈가 남아있지 않으면 break
     if not cnt: break
@@ -45,4 +58,4 @@ while True:
     time += 1
 
 # cnts[-1]은 0이다
-print(time, cnts[-2], sep='\n')
\ No newline at end of file
+print(time, cnts[-2], sep='\n')
@@ -1,66 +1,57 @@
 # 10026. 적록색약
 
-from collections import deque
+from array import array
 import sys
 
-dr = [0, 0, 1, -1]
-dc = [1, -1, 0, 0]
-
-# 적록색약이 아닌 사람이 봤을 때
-def bfs(r, c):
-    que = deque([[r, c]])
-
-    while que:
-        now = que.popleft()
-        for i in range(4):
-            nr = now[0] + dr[i]
-            nc = now[1] + dc[i]
-            if (0 <= nr < n) and (0 <= nc < n) and not visited_original[nr][nc]:
-                if picture[now[0]][now[1]] == picture[nr][nc]:
-                    visited_original[nr][nc] = True
-                    que.append([nr, nc])
-
-
-# 적록색약인 사람이 봤을 때
-# RG와 B로 구분했다.
-def cvd(r, c):
-    que = deque([[r, c]])
-
-    while que:
-        now = que.popleft()
-        for i in range(4):
-            nr = now[0] + dr[i]
-            nc = now[1] + dc[i]
-            if (0 <= nr < n) and (0 <= nc < n) and not visited_cvd[nr][nc]:
-                if (picture[now[0]][now[1]] in 'RG' and picture[nr][nc] in 'RG') or picture[now[0]][now[1]] == picture[nr][nc] == 'B':
-                    visited_cvd[nr][nc] = True
-                    que.append([nr, nc])
+# 같은 색끼리 이어진 구역의 개수
+# 바깥 칸은 어떤 색과도 같지 않으므로 범위 검사가 필요 없다
+def count(grid):
+    visited = bytearray(len(grid))
+    cnt = 0
+
+    for point in cells:
+        if visited[point]: continue
+        color = grid[point]
+        visited[point] = True
+        que[0] = point
+        head, tail = 0, 1
+
+        while head < tail:
+            now = que[head]
+            head += 1
+            for move in moves:
+                next_point = now + move
+                if not visited[next_point] and grid[next_point] == color:
+                    visited[next_point] = True
+                    que[tail] = next_point
+                    tail += 1
+        cnt += 1
+
+    return cnt
 
 
 n = int(sys.stdin.readline())
-visited_original = [[False for i in range(n)] for j in range(n)]
-visited_cvd = [[False for i in range(n)] for j in range(n)]
-picture = list()
-original = 0
-red_green = 0
+
+# 그림을 한 줄로 펴고 바깥을 빈 칸(.)으로 한 칸 둘러싼다
+# (r, c) 칸은 (r + 1) * W + (c + 1)이므로 상하좌우 이동은 ±1, ±W이다
+W = n + 2
+moves = (1, -1, W, -W)
+picture = bytearray(b'.') * (W * W)
+cells = [(i + 1) * W + j + 1 for i in range(n) for j in range(n)]
 
 # 그림 원본 데이터를 입력받는다
 for i in range(n):
-    picture.append(list(sys.stdin.readline().strip()))
+    picture[(i + 1) * W + 1:(i + 1) * W + n + 1] = sys.stdin.readline().strip().encode()
 
-# 구역 개수 세기
-for i in range(n):
-    for j in range(n):
-        if not visited_original[i][j]:
-            visited_original[i][j] = True
-            bfs(i, j)
-            original += 1
-        if not visited_cvd[i][j]:
-            visited_cvd[i][j] = True
-            cvd(i, j)
-            red_green += 1
+# 칸마다 큐에 한 번만 들어가므로 큐는 칸 수만큼 미리 잡아 둔다
+que = array('i', [0]) * len(cells)
+
+# 적록색약인 사람이 봤을 때
+# G를 R로 바꿔 RG와 B로 구분했다.
+original = count(picture)
+red_green = count(picture.replace(b'G', b'R'))
 
 print(original, red_green)
 
 
-# CVD는 Color Vision Deficiency의 약자
\ No newline at end of file
+# CVD는 Color Vision Deficiency의 약자
@@ -7,11 +7,12 @@ n, m = map(int, input().split())
 place = [list(map(int, input().split())) for i in range(n)]
 
 # 플로이드-워셜
+# 경유 파티장 i에 대해 j행 전체를 i행과 한 번에 비교해 새 행으로 바꾼다
 for i in range(n):
+    via = place[i]
     for j in range(n):
-        for k in range(n):
-            if place[j][i] + place[i][k] < place[j][k]:
-                place[j][k] = place[j][i] + place[i][k]
+        cost = place[j][i]
+        place[j] = [a if a <= cost + b else cost + b for a, b in zip(place[j], via)]
 
 # 입력 받은 경로를 지나는데 걸리는 시간과 입력 받은 시간 비교
 for i in range(m):
@@ -1,28 +1,77 @@
 # 1916. 최소비용 구하기
 
 import sys, heapq
+from array import array
 input = sys.stdin.readline
 
 n = int(input())
 m = int(input())
-bus = [[] for i in range(n + 1)]
-result = [int(1e9)] * (n + 1)
+INF = int(1e9)
+
+# 간선을 (출발, 도착, 비용) 배열로 먼저 받는다
+src = array('i', [0]) * m
+dst = array('i', [0]) * m
+cost = array('i', [0]) * m
 
 for i in range(m):
-    start, end, cost = map(int, input().split())
-    bus[start].append((cost, end))
+    src[i], dst[i], cost[i] = map(int, input().split())
+
+# 간선 배열을 CSR(compressed sparse row)로 변환
+# offset[v] ~ offset[v + 1] 구간이 v에서 나가는 간선
+def build(src, dst):
+    offset = array('i', [0]) * (n + 2)
+    for s in src:
+        offset[s + 1] += 1
+    for v in range(n + 1):
+        offset[v + 1] += offset[v]
+
+    target = array('i', [0]) * m
+    weight = array('i', [0]) * m
+    pos = offset[:]
+    for i in range(m):
+        s = src[i]
+        target[pos[s]] = dst[i]
+        weight[pos[s]] = cost[i]
+        pos[s] += 1
+
+    return offset, target, weight
+
+# 출발 도시에서는 원래 그래프를, 도착 도시에서는 뒤집은 그래프를 탐색한다
+graph = (build(src, dst), build(dst, src))
 
 initial, final = map(int, input().split())
-que = [(0, initial)]
-result[0] = 0
-
-# 다익스트라
-while que:
-    length, point = heapq.heappop(que)
-    if result[point] < length: continue
-    for next_length, next_point in bus[point]:
-        if length + next_length < result[next_point]:
-            heapq.heappush(que, (length + next_length, next_point))
-            result[next_point] = length + next_length
-
-print(result[final])
\ No newline at end of file
+
+# 양방향 다익스트라
+# 출발 도시와 도착 도시에서 동시에 탐색하고, 두 탐색이 만나는 경로 중 가장 짧은 것을 답으로 삼는다
+# 힙에는 (거리 << SHIFT) | 노드 형태의 정수 하나만 넣는다
+SHIFT = (n + 1).bit_length()
+MASK = (1 << SHIFT) - 1
+result = ([INF] * (n + 1), [INF] * (n + 1))
+result[0][initial] = 0
+result[1][final] = 0
+que = ([initial], [final])
+answer = 0 if initial == final else INF
+
+while que[0] and que[1]:
+    # 양쪽 힙의 최솟값 합이 지금까지 찾은 경로보다 길면 더 짧은 경로는 없다
+    if (que[0][0] >> SHIFT) + (que[1][0] >> SHIFT) >= answer: break
+
+    # 힙이 작은 쪽을 한 칸 진행한다
+    side = 0 if len(que[0]) <= len(que[1]) else 1
+    offset, target, weight = graph[side]
+    mine, other = result[side], result[1 - side]
+
+    key = heapq.heappop(que[side])
+    length, point = key >> SHIFT, key & MASK
+    if mine[point] < length: continue
+    for i in range(offset[point], offset[point + 1]):
+        next_point = target[i]
+        next_length = length + weight[i]
+        if next_length < mine[next_point]:
+            mine[next_point] = next_length
+            heapq.heappush(que[side], next_length << SHIFT | next_point)
+        # 반대쪽 탐색이 이미 도달한 노드라면 경로 후보가 된다
+        if next_length + other[next_point] < answer:
+            answer = next_length + other[next_point]
+
+print(answer)
@@ -1,33 +1,57 @@
 import sys, heapq
+from array import array
+from collections import deque
 input = sys.stdin.readline
 
+# BFS
+# 친구 관계는 모두 길이가 1이므로 회원마다 CSR 그래프 위의 BFS(n + 2e씩)로 다른 모든 회원까지의 거리를 구한다
+# 모든 회원이 서로 친구인 경우(완전 그래프)가 아니라면 BFS가 플로이드-워셜(n^2씩)보다 항상 빠르므로 플로이드-워셜은 쓰지 않는다
+# 요청받은 회원마다 거리 한 줄씩 내보내고, 거리 행렬 전체를 들고 있지 않는다
+def bfs_rows(sources):
+    offset = array('i', [0]) * (n + 1)
+    for a, b in friends:
+        offset[a + 1] += 1
+        offset[b + 1] += 1
+    for i in range(n):
+        offset[i + 1] += offset[i]
+
+    target = array('i', [0]) * (2 * len(friends))
+    pos = offset[:]
+    for a, b in friends:
+        target[pos[a]] = b
+        target[pos[b]] = a
+        pos[a] += 1
+        pos[b] += 1
+
+    for start in sources:
+        row = [int(1e9)] * n
+        row[start] = 0
+        que = deque([start])
+        while que:
+            point = que.popleft()
+            for i in range(offset[point], offset[point + 1]):
+                next_point = target[i]
+                if row[next_point] == int(1e9):
+                    row[next_point] = row[point] + 1
+                    que.append(next_point)
+        yield row
+
 n = int(input())
-relationship = [[int(1e9) for i in range(n)] for j in range(n)]
+friends = list()
 
 # 친구 관계 입력
 while True:
     a, b = map(int, input().split())
     if a == b == -1:
         break
-    relationship[a - 1][b - 1] = relationship[b - 1][a - 1] = 1
-
-for i in range(n):
-    relationship[i][i] = 0
-
-# 플로이드-워셜
-for i in range(n):
-    for j in range(n):
-        for k in range(n):
-            relationship[j][k] = min(relationship[j][k], relationship[j][i] + relationship[i][k])
+    friends.append((a - 1, b - 1))
 
 result = list()
 
 # 점수 매기기
-for i in range(n):
-    chk = 0
-    for j in range(n):
-        chk = max(chk, relationship[i][j])
-    heapq.heappush(result, (chk, i + 1))
+# 회원마다 거리 한 줄을 받아 가장 먼 거리만 남긴다
+for i, row in enumerate(bfs_rows(range(n))):
+    heapq.heappush(result, (max(row), i + 1))
 
 first_line = [0, 0]
 second_line = list()
@@ -47,4 +71,4 @@ while result:
             break
 
 print(*first_line)
-print(*second_line)
\ No newline at end of file
+print(*second_line)
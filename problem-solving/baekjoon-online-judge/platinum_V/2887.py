@@ -1,56 +1,69 @@
 # 2887. 행성 터널
 
-import heapq, sys
+import sys
+from array import array
 input = sys.stdin.readline
 
 
-def find(p):
-    if p != planet[p]:
-        planet[p] = find(planet[p])
-    return planet[p]
+# 유니온 파인드
+# 부모와 집합 크기를 array에 저장한다
+class DisjointSet:
+    def __init__(self, n):
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
 
+    # find 연산
+    # 재귀 대신 한 칸 건너뛴 조상을 가리키게 하면서(경로 절반 압축) 루트까지 올라간다
+    def find(self, p):
+        parent = self.parent
+        while p != parent[p]:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
 
-def union(p1, p2):
-    p1, p2 = find(p1), find(p2)
-    if p1 == p2: return True
-    if p1 <= p2: planet[p2] = p1
-    else: planet[p1] = p2
-    return False
+    # union 연산
+    # 크기가 작은 집합을 큰 집합 밑에 붙이고, 새로 합쳐졌으면 True를 반환한다
+    def union(self, p1, p2):
+        p1, p2 = self.find(p1), self.find(p2)
+        if p1 == p2: return False
+        if self.size[p1] < self.size[p2]: p1, p2 = p2, p1
+        self.parent[p2] = p1
+        self.size[p1] += self.size[p2]
+        return True
+
+
+# 축별 최소 스패닝 트리
+# 두 행성을 잇는 비용이 축마다의 좌표 차이 중 최솟값이면
+# 각 축으로 정렬했을 때 바로 옆에 있는 행성끼리의 간선만 후보로 보면 충분하다
+# 후보 간선은 (비용 << 2 * BITS) | (a << BITS) | b 정수 하나로 묶어 한 번에 정렬한다
+def axis_mst(n, axes):
+    BITS = n.bit_length()
+    MASK = (1 << BITS) - 1
+    paths = list()
+    for axis in axes:
+        order = sorted(range(n), key=axis.__getitem__)
+        value = [axis[i] for i in order]
+        paths.extend((b - a) << 2 * BITS | i << BITS | j for a, b, i, j in zip(value, value[1:], order, order[1:]))
+    paths.sort()
+
+    # 비용이 작은 후보부터 연결하고 n - 1개를 연결하면 멈춘다
+    dsu = DisjointSet(n)
+    total = picked = 0
+    for key in paths:
+        if picked == n - 1: break
+        if dsu.union(key >> BITS & MASK, key & MASK):
+            total += key >> 2 * BITS
+            picked += 1
+    return total
 
 
 n = int(input())
-coord = list()
+x = array('i', [0]) * n
+y = array('i', [0]) * n
+z = array('i', [0]) * n
 
-# 행성 좌표를 저장할 때 입력받은 순서도 같이 저장한다
+# 행성 좌표를 축마다 따로 저장한다
 for i in range(n):
-    data = list(map(int, input().split()))
-    coord.append(data + [i])
-
-# x, y, z 좌표로 좌표를 정렬한다
-x = sorted(coord, key=lambda x:x[0])
-y = sorted(coord, key=lambda x:x[1])
-z = sorted(coord, key=lambda x:x[2])
-
-planet = [i for i in range(n)]
-paths = list()
-result = 0
-ref = 0
-
-# 최소 힙에 거리 정보와 시작점과 도착점을 저장한다
-for i in range(n - 1):
-    heapq.heappush(paths, (abs(x[i][0] - x[i + 1][0]), x[i][3], x[i + 1][3]))
-    heapq.heappush(paths, (abs(y[i][1] - y[i + 1][1]), y[i][3], y[i + 1][3]))
-    heapq.heappush(paths, (abs(z[i][2] - z[i + 1][2]), z[i][3], z[i + 1][3]))
-
-# 경로 정보 힙에서 최소 거리를 확인한다
-# 시작점과 도착점이 연결되어 있지 않다면
-# 비용을 결과값에 더하고 연결 경로의 개수 변수 ref에 1을 더한다
-# ref가 n - 1이 될 때까지 반복한다
-while ref < n - 1:
-    cost, start, end = heapq.heappop(paths)
-    chk = union(start, end)
-    if not chk:
-        result += cost
-        ref += 1
-
-print(result)
\ No newline at end of file
+    x[i], y[i], z[i] = map(int, input().split())
+
+print(axis_mst(n, (x, y, z)))